@@ -1,21 +1,28 @@
 from loguru import logger
 import os
 
-from config.settings import settings
 
+log = logger
+_file_handler_id: int | None = None
 
-def setup_logger(path_log_file: str) -> logger:
+
+def setup_logger(path_log_file: str, debug: bool = False) -> logger:
     """
     Настраивает логирование с использованием библиотеки loguru.
 
     Логгер настраивается с параметрами:
         - Уровень логирования (DEBUG для информационных сообщений).
-        - Формат сообщений.
-        - Ротация логов при достижении 50 МБ.
-        - Включение стека вызовов (backtrace) и подробной диагностики (diagnose).
+        - Формат сообщений и запись в структурированном виде (JSON Lines, serialize).
+        - Ротация логов при достижении 50 МБ со сжатием архивных файлов.
+        - Запись сообщений в фоновом потоке через очередь (enqueue).
+        - Включение стека вызовов (backtrace) и подробной диагностики (diagnose) в режиме отладки.
+
+    При повторном вызове ранее добавленный файловый обработчик удаляется, чтобы сообщения
+    не дублировались в лог.
 
     Args:
         path_log_file (str): Путь к файлу лога.
+        debug (bool): Флаг режима отладки. По умолчанию False.
 
     Returns:
         logger: Настроенный объект логгера loguru.
@@ -26,16 +33,20 @@ def setup_logger(path_log_file: str) -> logger:
     log_dir = os.path.dirname(path_log_file)
     os.makedirs(log_dir, exist_ok=True)
 
-    logger.add(
-        settings.path_log_file,
+    global _file_handler_id
+    if _file_handler_id is not None:
+        logger.remove(_file_handler_id)
+
+    _file_handler_id = logger.add(
+        path_log_file,
         format=formatting,
         level="DEBUG",
+        serialize=True,
         rotation="50 MB",
-        backtrace=True,
-        diagnose=True,
+        compression="gz",
+        enqueue=True,
+        backtrace=debug,
+        diagnose=debug,
     )
 
     return logger
-
-
-log = setup_logger(settings.path_log_file)
@@ -1,8 +1,11 @@
 import os
+from functools import lru_cache
 
 from dotenv import load_dotenv, find_dotenv
-from pydantic import SecretStr, ValidationError
-from pydantic_settings import BaseSettings
+from pydantic import SecretStr, ValidationError, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+from utils.paths import PROJECT_ROOT
 
 
 env_file = find_dotenv()
@@ -24,35 +27,71 @@ class Settings(BaseSettings):
     name_folder_in_cloud_storage: str
     synchronization_period: int
     path_log_file: str = "logs/app.log"
+    debug: bool = False
+    sync_concurrency: int = 8
 
-    class Config:
-        env_file = ".env"
+    model_config = SettingsConfigDict(validate_default=True)
 
-    def __init__(self, **kwargs):
+    @field_validator("synchronization_period")
+    @classmethod
+    def _validate_synchronization_period(cls, value: int) -> int:
         """
-        Инициализирует экземпляр Settings.
-        Наследует и вызывает конструктор базового класса BaseSettings.
+        Приводит период синхронизации к положительному значению.
+
+        Args:
+            value (int): Период синхронизации из переменных окружения.
+
+        Returns:
+            int: Период синхронизации по модулю.
         """
 
-        super().__init__(**kwargs)
-        project_root = os.path.abspath(
-            os.path.join(os.path.dirname(__file__), os.path.pardir)
-        )
-        if self.synchronization_period < 0:
-            self.synchronization_period *= -1
-        if not os.path.isabs(self.path_folder):
-            self.path_folder = os.path.join(
-                os.path.join(project_root, self.path_folder)
-            )
+        return -value if value < 0 else value
+
+    @field_validator("sync_concurrency")
+    @classmethod
+    def _validate_sync_concurrency(cls, value: int) -> int:
+        """
+        Приводит количество одновременно передаваемых файлов к значению не меньше единицы.
+
+        Args:
+            value (int): Количество одновременно передаваемых файлов из переменных окружения.
+
+        Returns:
+            int: Количество одновременно передаваемых файлов.
+        """
+
+        return max(value, 1)
+
+    @field_validator("path_folder", "path_log_file")
+    @classmethod
+    def _validate_path(cls, value: str) -> str:
+        """
+        Преобразует относительный путь в абсолютный относительно корня проекта.
+
+        Args:
+            value (str): Путь из переменных окружения.
+
+        Returns:
+            str: Абсолютный путь.
+        """
+
+        return value if os.path.isabs(value) else os.path.join(PROJECT_ROOT, value)
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Возвращает настройки приложения. Экземпляр Settings создается один раз за время работы программы.
+
+    Returns:
+        Settings: Настройки приложения.
+    """
 
-        if not os.path.isabs(self.path_log_file):
-            self.path_log_file = os.path.join(
-                os.path.join(project_root, self.path_log_file)
-            )
+    return Settings()
 
 
 try:
-    settings = Settings()
+    settings = get_settings()
 except ValidationError as exc:
     dict_fields = {
         "yandex_disk_token": "YANDEX_DISK_TOKEN",
@@ -60,6 +99,8 @@ except ValidationError as exc:
         "name_folder_in_cloud_storage": "NAME_FOLDER_IN_CLOUD_STORAGE",
         "synchronization_period": "SYNCHRONIZATION_PERIOD",
         "path_log_file": "PATH_LOG_FILE",
+        "debug": "DEBUG",
+        "sync_concurrency": "SYNC_CONCURRENCY",
     }
 
     error_fields = [error.get("loc")[0] for error in exc.errors()]
@@ -1,3 +1,4 @@
+import atexit
 import os
 from time import sleep
 
@@ -5,23 +6,32 @@ from config.settings import settings
 from sync.metadata_manager import MetadataCache
 from sync.local_storage import ManagerLocalStorage
 from sync.sync_data import StorageSynchronizer
-from config.logging_config import log
-from utils.utils import get_ntp_time
+from sync.watcher import LocalFolderWatcher
+from config.logging_config import log, setup_logger
+from utils.ntp import ntp_offset
+from utils.paths import PROJECT_ROOT
 from sync.yandex_disk import ManagerYandexDiskStorage
 
 
+IDLE_CYCLES_BEFORE_BACKOFF = 3
+MAX_SYNC_PERIOD_FACTOR = 32
+
+
 def launch_file_synchronizer(
     token_user: str,
     path_local_folder_user: str,
     backup_folder_user: str,
     sync_period: int,
     path_cache: str = "metadata_local_cache.json",
+    sync_concurrency: int = 8,
 ) -> None:
     """
     Главная функция для запуска синхронизации данных между локальным и облачным хранилищем.
 
     Функция инициализирует менеджеры для локального и облачного хранилищ, кэш метаданных,
     а затем запускает бесконечный цикл синхронизации с заданным интервалом.
+    Если несколько синхронизаций подряд не выявили изменений, интервал удваивается
+    (но не более чем в MAX_SYNC_PERIOD_FACTOR раз), а при первом изменении возвращается к заданному.
     В случае ошибки при синхронизации файлы продолжают обрабатываться без остановки цикла.
 
     Args:
@@ -30,35 +40,60 @@ def launch_file_synchronizer(
         backup_folder_user (str): Имя папки в облачном хранилище.
         sync_period (int): Период синхронизации.
         path_cache (str): Путь к файлу кеша. По умолчанию "metadata_local_cache.json".
+        sync_concurrency (int): Количество одновременно передаваемых файлов. По умолчанию 8.
 
     Raises:
         Exception: Если при синхронизации файлов возникла ошибка.
     """
-    project_root = os.path.abspath(os.path.dirname(__file__))
     if not os.path.isabs(path_cache):
-        path_cache = os.path.join(os.path.join(project_root, path_cache))
+        path_cache = os.path.join(PROJECT_ROOT, path_cache)
 
-    sync_time = get_ntp_time()
+    ntp_offset.start()
 
-    manager_local = ManagerLocalStorage(path_local_folder_user, sync_time)
-    manager_cloud = ManagerYandexDiskStorage(token_user, backup_folder_user)
+    manager_local = ManagerLocalStorage(path_local_folder_user)
+    manager_cloud = ManagerYandexDiskStorage(
+        token_user, backup_folder_user, sync_concurrency
+    )
     manager_local_cache = MetadataCache(path_cache)
+    watcher = LocalFolderWatcher(manager_local.path_local_folder)
+    watcher.start()
 
     synchronizer = StorageSynchronizer(
-        manager_local, manager_cloud, manager_local_cache, sync_time
+        manager_local,
+        manager_cloud,
+        manager_local_cache,
+        watcher,
+        sync_concurrency,
     )
 
     synchronizer.synchronize_data(is_first_launch=True)
 
+    current_period = sync_period
+    idle_cycles = 0
+
     while True:
-        sleep(sync_period)
+        sleep(current_period)
         try:
-            synchronizer.synchronize_data()
+            stats = synchronizer.synchronize_data()
         except Exception as exc:
             log.error(f"Ошибка при синхронизации файлов {type(exc).__name__}: {exc}")
+            continue
+
+        if stats["changed"]:
+            idle_cycles = 0
+            current_period = sync_period
+        else:
+            idle_cycles += 1
+            if idle_cycles >= IDLE_CYCLES_BEFORE_BACKOFF:
+                current_period = min(
+                    current_period * 2, sync_period * MAX_SYNC_PERIOD_FACTOR
+                )
 
 
 if __name__ == "__main__":
+    setup_logger(settings.path_log_file, settings.debug)
+    atexit.register(log.complete)
+
     token = settings.yandex_disk_token.get_secret_value()
     path_local_folder = settings.path_folder
     backup_folder = settings.name_folder_in_cloud_storage
@@ -66,5 +101,10 @@ if __name__ == "__main__":
     path_cache = "metadata_cache.json"
 
     launch_file_synchronizer(
-        token, path_local_folder, backup_folder, synchronization_period, path_cache
+        token,
+        path_local_folder,
+        backup_folder,
+        synchronization_period,
+        path_cache,
+        settings.sync_concurrency,
     )
@@ -1,4 +1,5 @@
 from . import local_storage
 from . import metadata_manager
 from . import sync_data
+from . import watcher
 from . import yandex_disk
\ No newline at end of file
@@ -1,9 +1,10 @@
 import math
 import os
-from datetime import datetime, timezone
 
 from config.settings import settings
-from utils.utils import get_file_path, get_time_correlation
+from utils.ntp import ntp_offset
+from utils.paths import PROJECT_ROOT
+from utils.utils import IGNORED_FILE_PREFIXES, get_time_correlation
 from config.logging_config import log
 
 
@@ -13,7 +14,6 @@ class ManagerLocalStorage:
 
     Attributes:
         _path_local_folder (str): Путь к локальной папке, с которой работает класс.
-        _sync_time (int): Время синхронизации для корректировки временных меток файлов.
 
     Methods:
         path_local_folder: Геттер и сеттер для пути к локальной директории.
@@ -21,17 +21,17 @@ class ManagerLocalStorage:
         delete(file_name): Удаляет файл из локальной директории.
     """
 
-    def __init__(self, path_local_folder: str, sync_time: int) -> None:
+    _IGNORED_PREFIXES = IGNORED_FILE_PREFIXES
+
+    def __init__(self, path_local_folder: str) -> None:
         """
         Инициализация ManagerLocalStorage.
 
         Args:
             path_local_folder (str): Путь к локальной директории.
-            sync_time (int): Время синхронизации для корректировки временных меток файлов.
         """
 
         self._path_local_folder = path_local_folder
-        self._sync_time = sync_time
         self._ensure_local_folder_exists()
 
     def _ensure_local_folder_exists(self) -> None:
@@ -46,12 +46,9 @@ class ManagerLocalStorage:
 
         if not self._path_local_folder or not os.path.isdir(self._path_local_folder):
             default_folder = "local_folder_sync"
-            project_root = os.path.abspath(
-                os.path.join(os.path.dirname(__file__), os.path.pardir)
-            )
 
             if not self._path_local_folder:
-                self._path_local_folder = os.path.join(project_root, default_folder)
+                self._path_local_folder = os.path.join(PROJECT_ROOT, default_folder)
                 log.error(
                     "Путь к локальной директории не задан. "
                     f"Создана папка по умолчанию: {self._path_local_folder}"
@@ -63,7 +60,7 @@ class ManagerLocalStorage:
                     f"Создана папка для локального хранения данных: {self._path_local_folder}"
                 )
             except OSError as exc:
-                self._path_local_folder = os.path.join(project_root, default_folder)
+                self._path_local_folder = os.path.join(PROJECT_ROOT, default_folder)
                 os.makedirs(self._path_local_folder, exist_ok=True)
                 log.error(f"Ошибка при создании директории: {exc}. ")
                 log.info(f"Создана папка по умолчанию: {self._path_local_folder}")
@@ -107,9 +104,7 @@ class ManagerLocalStorage:
         """
         try:
             file_path = os.path.join(self._path_local_folder, file_name)
-            mod_time = os.path.getmtime(file_path)
-            local_time = datetime.fromtimestamp(mod_time, tz=timezone.utc)
-            return math.ceil(local_time.timestamp())
+            return math.ceil(os.path.getmtime(file_path))
         except FileNotFoundError as exc:
             log.error(f"Файл {file_name} не найден: {exc}")
         except OSError as exc:
@@ -125,47 +120,46 @@ class ManagerLocalStorage:
         Raises:
             FileNotFoundError: Если файл не найден.
             OSError: Если возникла ошибка доступа к файлу.
-            Exception: Если возникает непредвиденная ошибка.
         """
         try:
-            file_path = get_file_path(self._path_local_folder, file_name)
-            os.remove(file_path)
+            os.remove(os.path.join(self._path_local_folder, file_name))
             log.info(f"Локальный файл {file_name} успешно удален.")
         except FileNotFoundError:
-            # log.error(f"Локальный файл {file_name} не найден.")
-            raise FileNotFoundError(f"Локальный файл {file_name} не найден.")
-
+            raise
         except OSError as exc:
             log.error(f"Ошибка доступа к файлу {file_name}: {exc}")
-            raise OSError(exc)
-
-        except Exception as exc:
-            raise Exception(
-                f"Ошибка при удалении локального файла {file_name} {type(exc).__name__}: {exc}"
-            )
+            raise
 
-    def get_info(self) -> dict[str, int] | None:
+    def get_info(self) -> dict[str, int]:
         """
         Возвращает информацию о файлах в локальной директории с указанием времени последнего их изменения.
-        Файлы, начинающиеся с символа "~", игнорируются.
+        Временные файлы редакторов (имена которых начинаются с "~", ".~", ".#") игнорируются.
+        Ошибки доступа к отдельным файлам логируются, такие файлы не включаются в результат.
 
         Returns:
             dict[str, int]: Словарь, где ключ — имя файла, значение — время последнего изменения в формате
                 Unix timestamp.
 
         Raises:
-            FileNotFoundError: Если файл не найден по указанному пути.
-            OSError: Если возникла другая ошибка при доступе к файлу.
+            OSError: Если локальная директория отсутствовала (она создается заново) или недоступна.
         """
-        try:
-            local_files = {}
-            for file_name in os.listdir(self._path_local_folder):
-                file_path = os.path.join(self._path_local_folder, file_name)
-                if os.path.isfile(file_path) and not file_name.startswith("~"):
+
+        if not os.path.isdir(self._path_local_folder):
+            self._ensure_local_folder_exists()
+
+            raise OSError(
+                f"Ошибка доступа к локальной директории {self._path_local_folder}"
+            )
+
+        local_files = {}
+        ignored_prefixes = self._IGNORED_PREFIXES
+        with os.scandir(self._path_local_folder) as entries:
+            for entry in entries:
+                file_name = entry.name
+                if entry.is_file() and not file_name.startswith(ignored_prefixes):
                     try:
-                        time_modified = self._get_file_time_modified(file_name)
                         local_files[file_name] = get_time_correlation(
-                            time_modified, self._sync_time
+                            math.ceil(entry.stat().st_mtime), ntp_offset.offset
                         )
                     except FileNotFoundError:
                         log.error(
@@ -177,16 +171,55 @@ class ManagerLocalStorage:
                     log.info(
                         f"{file_name} является недопустимым файлом или директорией."
                     )
-        except OSError:
-            os.makedirs(self._path_local_folder, exist_ok=True)
+
+        return local_files
+
+    def update_info(
+        self, local_info: dict[str, int], file_names: set[str]
+    ) -> dict[str, int]:
+        """
+        Обновляет информацию только об указанных файлах локальной директории, не сканируя её целиком.
+        Отсутствующие и недопустимые файлы удаляются из информации о файлах.
+
+        Args:
+            local_info (dict[str, int]): Информация о файлах, полученная при предыдущей синхронизации.
+            file_names (set[str]): Имена файлов, изменившихся с момента предыдущей синхронизации.
+
+        Returns:
+            dict[str, int]: Обновленная информация о файлах в локальной директории.
+
+        Raises:
+            OSError: Если локальная директория недоступна.
+        """
+
+        if not os.path.isdir(self._path_local_folder):
+            self._ensure_local_folder_exists()
 
             raise OSError(
                 f"Ошибка доступа к локальной директории {self._path_local_folder}"
             )
 
-        return local_files
+        ignored_prefixes = self._IGNORED_PREFIXES
+        for file_name in file_names:
+            if file_name.startswith(ignored_prefixes):
+                continue
+
+            file_path = os.path.join(self._path_local_folder, file_name)
+            try:
+                if os.path.isfile(file_path):
+                    local_info[file_name] = get_time_correlation(
+                        math.ceil(os.path.getmtime(file_path)), ntp_offset.offset
+                    )
+                    continue
+            except FileNotFoundError:
+                pass
+            except OSError as exc:
+                log.error(f"Ошибка при доступе к файлу {file_name}: {exc}")
+            local_info.pop(file_name, None)
+
+        return local_info
 
 
 if __name__ == "__main__":
-    local_manager = ManagerLocalStorage(settings.path_folder, sync_time=0)
+    local_manager = ManagerLocalStorage(settings.path_folder)
     print(local_manager.get_info())
@@ -1,25 +1,50 @@
-import json
 import os
+from threading import Event, Lock, Thread
+from typing import Iterable
+
+import orjson
 
 from config.logging_config import log
+from utils.paths import PROJECT_ROOT
 
 
 class MetadataCache:
     """
     Класс для управления данными кеша.
 
+    Изменения кеша записываются в файл фоновым потоком через _FLUSH_DELAY секунд после последнего изменения.
+    Фоновая запись лишь страхует от потери изменений между вызовами flush: основной записью остается
+    вызов flush в конце синхронизации.
+
     Attributes:
         _cache (str): Путь к файлу кеша.
         _metadata (dict[str, int]): Информация о файлах в кеше в виде словаря с именами файлов и временем их изменения.
+        _checksums (dict[str, str]): MD5 содержимого файлов на момент их последней передачи.
+        _fingerprints (dict[str, str]): Отпечатки содержимого локальных файлов на момент их последней передачи.
+        _dirty (bool): Флаг наличия изменений кеша, еще не записанных в файл.
+        _lock (Lock): Блокировка для изменения данных кеша и их записи в файл из разных потоков.
+        _flush_event (Event): Событие появления изменений кеша для фоновой записи.
+        _flush_thread (Thread | None): Фоновый поток отложенной записи изменений кеша в файл.
 
     Methods:
         cache (str): Геттер и сеттер для пути к файлу кеша.
         metadata (dict[str, int]): Геттер и сеттер для информации о файлах в кеше.
+        checksums (dict[str, str]): Геттер для MD5 содержимого файлов в кеше.
+        fingerprints (dict[str, str]): Геттер для отпечатков содержимого локальных файлов в кеше.
         update_file_cache (str, int): Обновляет информацию о файле в кеше.
         delete_file_cache (str): Удаляет информацию о файле из кеша.
+        bulk_update (dict[str, int], Iterable[str], dict | None, dict | None): Обновляет и удаляет
+            информацию о нескольких файлах.
+        shift_times (int): Сдвигает время изменения всех файлов в кеше.
+        flush: Записывает накопленные изменения кеша в файл.
+        diff (dict[str, int]) -> tuple[set[str], set[str], set[str]]: Сравнивает информацию о файлах с кешем.
         get_mod_time (str) -> int: Возвращает время последнего изменения файла из кеша.
+        get_checksum (str) -> str | None: Возвращает MD5 содержимого файла из кеша.
+        get_fingerprint (str) -> str | None: Возвращает отпечаток содержимого локального файла из кеша.
     """
 
+    _FLUSH_DELAY = 0.2
+
     def __init__(self, cache: str) -> None:
         """
         Инициализация MetadataCache.
@@ -30,7 +55,11 @@ class MetadataCache:
 
         self._cache = cache
         self._ensure_cache_file_exists()
-        self._metadata = self._load_cache()
+        self._metadata, self._checksums, self._fingerprints = self._load_cache()
+        self._dirty = False
+        self._lock = Lock()
+        self._flush_event = Event()
+        self._flush_thread = None
 
     @property
     def cache(self) -> str:
@@ -70,13 +99,51 @@ class MetadataCache:
     def metadata(self, metadata: dict[str, int]) -> None:
         """
         Устанавливает новую информацию о файлах в кеше и записывает её в файл.
+        Кеш хранит копию словаря, поэтому последующие изменения переданного словаря его не затрагивают.
+        Если информация не изменилась, файл кеша не перезаписывается.
 
         Args:
             metadata (dict[str, int]): Новая информация о файлах.
         """
 
-        self._metadata = metadata
-        self._dump_cache()
+        if metadata == self._metadata:
+            return
+        with self._lock:
+            self._metadata = dict(metadata)
+            self._checksums = {
+                file_name: checksum
+                for file_name, checksum in self._checksums.items()
+                if file_name in self._metadata
+            }
+            self._fingerprints = {
+                file_name: fingerprint
+                for file_name, fingerprint in self._fingerprints.items()
+                if file_name in self._metadata
+            }
+            self._dump_cache()
+            self._dirty = False
+
+    @property
+    def checksums(self) -> dict[str, str]:
+        """
+        Возвращает MD5 содержимого файлов в кеше.
+
+        Returns:
+            dict[str, str]: Словарь с именами файлов и MD5 их содержимого на момент последней передачи.
+        """
+
+        return self._checksums
+
+    @property
+    def fingerprints(self) -> dict[str, str]:
+        """
+        Возвращает отпечатки содержимого локальных файлов в кеше.
+
+        Returns:
+            dict[str, str]: Словарь с именами файлов и отпечатками их содержимого на момент последней передачи.
+        """
+
+        return self._fingerprints
 
     def _ensure_cache_file_exists(self) -> None:
         """
@@ -86,91 +153,249 @@ class MetadataCache:
 
         if not self._cache.endswith(".json"):
             default_cache_file = "metadata_local_cache.json"
-            project_root = os.path.abspath(
-                os.path.join(os.path.dirname(__file__), os.path.pardir)
-            )
-            self._cache = os.path.join(project_root, default_cache_file)
+            self._cache = os.path.join(PROJECT_ROOT, default_cache_file)
 
             log.error("Путь к файлу кеша отсутствует или задан неверно.")
             log.info(f"Задан путь к файлу кеша по умолчанию: {self._cache}")
 
-    def _load_cache(self) -> dict[str, int]:
+    def _load_cache(self) -> tuple[dict[str, int], dict[str, str], dict[str, str]]:
         """
         Извлекает данные из кеша.
+        Файл кеша прежнего формата, содержащий только время изменения файлов, читается без MD5 и отпечатков.
+        Файл, корнем которого не является JSON-объект, считается поврежденным, и кеш считается пустым.
 
         Returns:
-            dict[str, int]: Словарь с данными о файлах в кеше.
+            tuple[dict[str, int], dict[str, str], dict[str, str]]: Словари с временем изменения, MD5
+                и отпечатками содержимого файлов в кеше.
 
         Raises:
             IOError: Если возникла ошибка при чтении кэша.
-            json.JSONDecodeError: Если возникла ошибка при сериализации данных в JSON.
+            orjson.JSONDecodeError: Если возникла ошибка при десериализации данных из JSON.
         """
 
         if os.path.exists(self._cache):
             try:
-                with open(self._cache, "r", encoding="utf-8") as file_data:
-                    return json.load(file_data)
-            except (IOError, json.JSONDecodeError) as exc:
+                with open(self._cache, "rb") as file_data:
+                    data = orjson.loads(file_data.read())
+            except (IOError, orjson.JSONDecodeError) as exc:
                 log.error(f"Ошибка при чтении кэша {type(exc).__name__}: {exc}")
-                return {}
-        return {}
+                return {}, {}, {}
+            if not isinstance(data, dict):
+                log.error(
+                    f"Ошибка при чтении кэша: ожидался JSON-объект, получен {type(data).__name__}."
+                )
+                return {}, {}, {}
+            if isinstance(data.get("metadata"), dict):
+                return (
+                    data["metadata"],
+                    data.get("checksums", {}),
+                    data.get("fingerprints", {}),
+                )
+            return data, {}, {}
+        return {}, {}, {}
 
     def _dump_cache(self) -> None:
         """
         Записывает данные в файл кеша.
+        Данные сначала записываются во временный файл, который затем заменяет файл кеша,
+        чтобы при сбое записи файл кеша не оказался поврежденным.
 
         Raises:
             IOError: Если возникла ошибка при записи в кэш.
-            json.JSONDecodeError: Если возникла ошибка при сериализации данных в JSON.
+            orjson.JSONEncodeError: Если возникла ошибка при сериализации данных в JSON.
         """
 
+        tmp_cache = f"{self._cache}.tmp"
         try:
-            with open(self._cache, "w", encoding="utf-8") as file_data:
-                json.dump(self._metadata, file_data, indent=4, ensure_ascii=False)
-        except (IOError, json.JSONDecodeError) as exc:
+            with open(tmp_cache, "wb") as file_data:
+                file_data.write(
+                    orjson.dumps(
+                        {
+                            "metadata": self._metadata,
+                            "checksums": self._checksums,
+                            "fingerprints": self._fingerprints,
+                        },
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                    )
+                )
+            os.replace(tmp_cache, self._cache)
+        except (IOError, orjson.JSONEncodeError) as exc:
             log.error(f"Ошибка при записи в кэш: {exc}")
 
+    def _flush_worker(self) -> None:
+        """
+        Записывает изменения кеша в файл в фоновом потоке, когда в течение _FLUSH_DELAY секунд
+        не появляется новых изменений.
+        """
+
+        while True:
+            self._flush_event.wait()
+            self._flush_event.clear()
+            while self._flush_event.wait(self._FLUSH_DELAY):
+                self._flush_event.clear()
+            self.flush()
+
+    def _schedule_flush(self) -> None:
+        """
+        Планирует запись изменений кеша в файл через _FLUSH_DELAY секунд после последнего изменения.
+        Каждое новое изменение откладывает запись, поэтому серия изменений записывается в файл один раз.
+        Фоновый поток записи запускается при первом изменении и не задерживает завершение программы.
+        """
+
+        if not self._dirty:
+            return
+        if self._flush_thread is None:
+            self._flush_thread = Thread(
+                target=self._flush_worker, name="cache-flush", daemon=True
+            )
+            self._flush_thread.start()
+        self._flush_event.set()
+
     def update_file_cache(self, file_name: str, mod_time: int) -> None:
         """
-        Обновляет данные файла в кеше и записывает их в файл.
+        Обновляет данные файла в кеше. Изменения записываются в файл с задержкой или при вызове flush.
 
         Args:
             file_name (str): Имя файла.
             mod_time (int): Время последнего изменения файла.
         """
 
-        self._metadata[file_name] = mod_time
-        self._dump_cache()
+        with self._lock:
+            if self._metadata.get(file_name) == mod_time:
+                return
+            self._metadata[file_name] = mod_time
+            self._dirty = True
+            self._schedule_flush()
 
     def delete_file_cache(self, file_name: str) -> None:
         """
-        Удаляет данные о файле из кеша и обновляет файл кеша.
+        Удаляет данные о файле из кеша. Изменения записываются в файл с задержкой или при вызове flush.
 
         Args:
             file_name (str): Имя файла для удаления.
-
-        Raises:
-            Exception: Если возникла ошибка при обновлении кеша.
         """
 
-        if file_name in self._metadata:
-            self._metadata.pop(file_name)
-            try:
-                self._dump_cache()
-            except Exception as exc:
-                log.error(
-                    f"Ошибка при обновлении кеша после удаления файла '{file_name}': {exc}"
+        with self._lock:
+            if file_name in self._metadata:
+                self._metadata.pop(file_name)
+                self._checksums.pop(file_name, None)
+                self._fingerprints.pop(file_name, None)
+                self._dirty = True
+                self._schedule_flush()
+            else:
+                log.info(
+                    f"Файл '{file_name}' не найден в кеше. Удаление не требуется."
                 )
-        else:
-            log.info(f"Файл '{file_name}' не найден в кеше. Удаление не требуется.")
+
+    def bulk_update(
+        self,
+        changes: dict[str, int],
+        removed: Iterable[str],
+        checksums: dict[str, str | None] | None = None,
+        fingerprints: dict[str, str | None] | None = None,
+    ) -> None:
+        """
+        Обновляет данные нескольких файлов и удаляет данные о файлах из кеша за один проход.
+        Изменения записываются в файл с задержкой или при вызове flush.
+
+        Args:
+            changes (dict[str, int]): Имена файлов и время их последнего изменения.
+            removed (Iterable[str]): Имена файлов для удаления.
+            checksums (dict[str, str | None] | None): Имена файлов и MD5 их содержимого.
+                Значение None удаляет MD5 файла из кеша. По умолчанию None.
+            fingerprints (dict[str, str | None] | None): Имена файлов и отпечатки их содержимого.
+                Значение None удаляет отпечаток файла из кеша. По умолчанию None.
+        """
+
+        with self._lock:
+            metadata = self._metadata
+            for file_name, mod_time in changes.items():
+                if metadata.get(file_name) != mod_time:
+                    metadata[file_name] = mod_time
+                    self._dirty = True
+            for hashes, updates in (
+                (self._checksums, checksums),
+                (self._fingerprints, fingerprints),
+            ):
+                for file_name, value in (updates or {}).items():
+                    if value is None:
+                        if hashes.pop(file_name, None) is not None:
+                            self._dirty = True
+                    elif file_name in metadata and hashes.get(file_name) != value:
+                        hashes[file_name] = value
+                        self._dirty = True
+            for file_name in removed:
+                self._checksums.pop(file_name, None)
+                self._fingerprints.pop(file_name, None)
+                if metadata.pop(file_name, None) is not None:
+                    self._dirty = True
+            self._schedule_flush()
+
+    def shift_times(self, shift: int) -> None:
+        """
+        Сдвигает время изменения всех файлов в кеше на указанное количество секунд.
+        Изменения записываются в файл с задержкой или при вызове flush.
+
+        Args:
+            shift (int): Сдвиг времени в секундах.
+        """
+
+        with self._lock:
+            if not shift or not self._metadata:
+                return
+            self._metadata = {
+                file_name: mod_time + shift
+                for file_name, mod_time in self._metadata.items()
+            }
+            self._dirty = True
+            self._schedule_flush()
 
     def delete_data_cache(self) -> None:
         """
-        Полностью очищает кеш.
+        Полностью очищает кеш. Изменения записываются в файл с задержкой или при вызове flush.
+        """
+
+        with self._lock:
+            if not self._metadata:
+                return
+            self._metadata = {}
+            self._checksums = {}
+            self._fingerprints = {}
+            self._dirty = True
+            self._schedule_flush()
+
+    def flush(self) -> None:
+        """
+        Записывает данные кеша в файл, если с момента последней записи они изменились.
+        Основной способ записи кеша: вызывается в конце каждой синхронизации.
+        """
+
+        with self._lock:
+            if self._dirty:
+                self._dump_cache()
+                self._dirty = False
+
+    def diff(self, current: dict[str, int]) -> tuple[set[str], set[str], set[str]]:
         """
+        Сравнивает информацию о файлах хранилища с данными кеша.
+
+        Args:
+            current (dict[str, int]): Информация о файлах в локальном или облачном хранилище.
 
-        self._metadata = {}
-        self._dump_cache()
+        Returns:
+            tuple[set[str], set[str], set[str]]: Имена файлов, отсутствующих в кеше; имена файлов из кеша,
+                отсутствующих в хранилище; имена файлов, измененных позже времени, записанного в кеше.
+        """
+
+        metadata = self._metadata
+        added = current.keys() - metadata.keys()
+        removed = metadata.keys() - current.keys()
+        modified = {
+            file_name
+            for file_name in current.keys() & metadata.keys()
+            if current[file_name] > metadata[file_name]
+        }
+        return added, removed, modified
 
     def get_mod_time(self, file_name) -> int:
         """
@@ -184,3 +409,29 @@ class MetadataCache:
         """
 
         return self._metadata.get(file_name)
+
+    def get_checksum(self, file_name: str) -> str | None:
+        """
+        Возвращает MD5 содержимого файла из кеша.
+
+        Args:
+            file_name (str): Имя файла.
+
+        Returns:
+            str | None: MD5 содержимого файла на момент последней передачи либо None, если он неизвестен.
+        """
+
+        return self._checksums.get(file_name)
+
+    def get_fingerprint(self, file_name: str) -> str | None:
+        """
+        Возвращает отпечаток содержимого локального файла из кеша.
+
+        Args:
+            file_name (str): Имя файла.
+
+        Returns:
+            str | None: Отпечаток содержимого файла на момент последней передачи либо None, если он неизвестен.
+        """
+
+        return self._fingerprints.get(file_name)
@@ -1,13 +1,18 @@
-from time import time
+import os
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from threading import Lock
+from time import monotonic, sleep, time
 
 from requests.exceptions import ConnectionError
 
 from utils.exceptions import DiskNotFoundError, UnauthorizedError
+from utils.ntp import ntp_offset
+from utils.utils import get_file_fingerprint, get_file_md5
 from sync.metadata_manager import MetadataCache
-from utils.utils import get_time_correlation
 from sync.yandex_disk import ManagerYandexDiskStorage
 from config.logging_config import log
 from sync.local_storage import ManagerLocalStorage
+from sync.watcher import LocalFolderWatcher
 
 
 class StorageSynchronizer:
@@ -20,18 +25,37 @@ class StorageSynchronizer:
         _cache (MetadataCache): Объект класса MetadataCache.
         _local_info (dict[str, int] | None): Информация о файлах в локальном хранилище.
         _cloud_info (dict[str, int] | None): Информация о файлах в облаке.
-        _sync_time (int): Время синхронизации для корректировки временных меток файлов.
+        _cloud_checksums (dict[str, str]): MD5 содержимого файлов в облаке, полученные вместе с информацией
+            о файлах в облаке.
+        _watcher (LocalFolderWatcher | None): Объект для отслеживания изменений в локальной директории.
+        _is_started (bool): Флаг, указывающий, что в текущем запуске программы уже начиналась синхронизация.
+        _last_full_scan (float | None): Время последнего полного сканирования локальной директории
+            по монотонным часам.
+        _changed_count (int): Количество файлов, переданных или удаленных за текущую синхронизацию.
+        _cache_changes (dict[str, int]): Изменения данных кеша, накопленные за текущий этап синхронизации.
+        _cache_removed (set[str]): Имена файлов для удаления из кеша, накопленные за текущий этап синхронизации.
+        _cache_checksums (dict[str, str | None]): MD5 переданных файлов, накопленные за текущий этап
+            синхронизации.
+        _cache_fingerprints (dict[str, str | None]): Отпечатки содержимого переданных файлов, накопленные
+            за текущий этап синхронизации.
+        _pool (ThreadPoolExecutor): Пул потоков для параллельной передачи файлов.
+        _lock (Lock): Блокировка для изменения информации о файлах и данных кеша из потоков пула.
 
     Methods:
         synchronize_data: Выполняет полную синхронизацию файлов.
     """
 
+    _MAX_RETRIES = 5
+    _MAX_RETRY_DELAY = 60
+    _FULL_SCAN_PERIOD = 600
+
     def __init__(
         self,
         manager_local: ManagerLocalStorage,
         manager_cloud: ManagerYandexDiskStorage,
         metadata_cache: MetadataCache,
-        sync_time: int,
+        watcher: LocalFolderWatcher | None = None,
+        max_workers: int = 8,
     ) -> None:
         """
         Инициализация StorageSynchronizer.
@@ -40,6 +64,9 @@ class StorageSynchronizer:
             manager_local (ManagerLocalStorage): Объект класса ManagerLocalStorage.
             manager_cloud (ManagerYandexDiskStorage): Объект класса ManagerYandexDiskStorage.
             metadata_cache (MetadataCache): Объект класса MetadataCache.
+            watcher (LocalFolderWatcher | None): Объект для отслеживания изменений в локальной директории.
+                Если не задан, при каждой синхронизации выполняется полное сканирование директории.
+            max_workers (int): Количество одновременно передаваемых файлов. По умолчанию 8.
         """
 
         self._manager_local = manager_local
@@ -47,64 +74,264 @@ class StorageSynchronizer:
         self._cache = metadata_cache
         self._local_info = {}
         self._cloud_info = {}
-        self._sync_time = sync_time
+        self._cloud_checksums = {}
+        self._watcher = watcher
+        self._is_started = False
+        self._last_full_scan = None
+        self._changed_count = 0
+        self._cache_changes = {}
+        self._cache_removed = set()
+        self._cache_checksums = {}
+        self._cache_fingerprints = {}
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+        self._lock = Lock()
+
+    def _apply_time_offset(self) -> None:
+        """
+        Применяет обновленную разницу во времени с NTP сервером перед циклом синхронизации.
+        Время изменения файлов в кеше и в информации о локальных файлах сдвигается на изменение
+        разницы, чтобы файлы не считались измененными из-за новой коррекции времени.
+        Перед первым циклом синхронизации время не сдвигается: кеш записан в предыдущем запуске программы
+        уже с разницей, полученной от NTP сервера.
+        """
 
-    def _update_data(self, file_name: str, storage_info: dict[str, int]) -> None:
+        shift = ntp_offset.apply_pending()
+        is_started = self._is_started
+        self._is_started = True
+        if not shift or not is_started:
+            return
+
+        self._cache.shift_times(shift)
+        self._local_info = {
+            file_name: mod_time + shift
+            for file_name, mod_time in self._local_info.items()
+        }
+        log.info(
+            f"Разница во времени с NTP сервером изменилась на {shift} с., время изменения файлов в кеше пересчитано."
+        )
+
+    def _get_local_info(self, is_first_launch: bool = False) -> dict[str, int]:
+        """
+        Возвращает информацию о файлах в локальном хранилище. Если доступны изменения, накопленные
+        отслеживанием директории, обновляется информация только об измененных файлах, иначе
+        директория сканируется полностью.
+        Полное сканирование также выполняется не реже чем раз в _FULL_SCAN_PERIOD секунд, чтобы
+        изменения, пропущенные отслеживанием директории, не терялись.
+
+        Args:
+            is_first_launch (bool): Флаг для выполнения первого запуска синхронизации файлов. По умолчанию False.
+
+        Returns:
+            dict[str, int]: Информация о файлах в локальном хранилище.
+        """
+
+        changes = self._watcher.pop_changes() if self._watcher else None
+        if (
+            changes is None
+            or is_first_launch
+            or self._last_full_scan is None
+            or monotonic() - self._last_full_scan >= self._FULL_SCAN_PERIOD
+        ):
+            local_info = self._manager_local.get_info()
+            self._last_full_scan = monotonic()
+            return local_info
+        return self._manager_local.update_info(self._local_info, changes)
+
+    def _update_data(
+        self,
+        file_name: str,
+        storage_info: dict[str, int],
+        checksum: str | None = None,
+        fingerprint: str | None = None,
+    ) -> None:
         """
         Обновляет данные кеша и информации о файлах локального или облачного хранилища.
+        MD5 и отпечаток содержимого файла в кеше заменяются переданными: неизвестные значения удаляются,
+        так как содержимое файла изменилось.
+        Изменения кеша применяются в конце этапа синхронизации методом _commit_cache_changes.
 
         Args:
             file_name (str): Имя файла.
             storage_info (dict[str, int]): Информация о файлах в локальном или облачном хранилище.
-
-        Raises:
-            Exception: Если при обновлении файла возникла ошибка.
+            checksum (str | None): MD5 содержимого переданного файла. По умолчанию None.
+            fingerprint (str | None): Отпечаток содержимого переданного файла. По умолчанию None.
         """
 
-        try:
-            current_time = time()
-            time_change = get_time_correlation(current_time, self._sync_time)
+        time_change = int(time()) + 1 + ntp_offset.offset
+        with self._lock:
             storage_info[file_name] = time_change
-            self._cache.update_file_cache(file_name, time_change)
-        except Exception as exc:
-            raise Exception(
-                f"Ошибка при обновлении данных для файла {file_name}: {exc}"
-            )
+            self._cache_changes[file_name] = time_change
+            self._cache_removed.discard(file_name)
+            self._cache_checksums[file_name] = checksum
+            self._cache_fingerprints[file_name] = fingerprint
+            self._changed_count += 1
 
     def _delete_data(self, file_name: str, storage_info: dict[str, int]) -> None:
         """
         Удаляет данные из кеша и из информации о файлах локального или облачного хранилища.
+        Изменения кеша применяются в конце этапа синхронизации методом _commit_cache_changes.
 
         Args:
             file_name (str): Имя файла.
             storage_info (dict[str, int]): Информация о файлах в локальном или облачном хранилище.
         """
 
-        if file_name in storage_info:
-            storage_info.pop(file_name)
-        self._cache.delete_file_cache(file_name)
+        with self._lock:
+            storage_info.pop(file_name, None)
+            self._cache_changes.pop(file_name, None)
+            self._cache_checksums.pop(file_name, None)
+            self._cache_fingerprints.pop(file_name, None)
+            self._cache_removed.add(file_name)
+            self._changed_count += 1
 
-    def _transfer_to_storage(
-        self, file_name: str, storage_info: dict[str, int], func_transfer: callable
+    def _touch_data(
+        self,
+        file_name: str,
+        mod_time: int,
+        checksum: str | None = None,
+        fingerprint: str | None = None,
     ) -> None:
+        """
+        Обновляет в кеше время изменения файла, содержимое которого не изменилось, без его передачи.
+        Переданные MD5 и отпечаток содержимого дополняют данные кеша.
+        Изменения кеша применяются в конце этапа синхронизации методом _commit_cache_changes.
+
+        Args:
+            file_name (str): Имя файла.
+            mod_time (int): Время последнего изменения файла.
+            checksum (str | None): MD5 содержимого файла. По умолчанию None.
+            fingerprint (str | None): Отпечаток содержимого файла. По умолчанию None.
+        """
+
+        with self._lock:
+            self._cache_changes[file_name] = mod_time
+            self._cache_removed.discard(file_name)
+            if checksum is not None:
+                self._cache_checksums[file_name] = checksum
+            if fingerprint is not None:
+                self._cache_fingerprints[file_name] = fingerprint
+
+    @staticmethod
+    def _wait_all(futures: list[Future]) -> None:
+        """
+        Ожидает завершения всех задач пула потоков и логирует возникшие в них ошибки.
+
+        Args:
+            futures (list[Future]): Задачи пула потоков.
+        """
+
+        for future in as_completed(futures):
+            exc = future.exception()
+            if exc is not None:
+                log.error(exc)
+
+    def _commit_cache_changes(self) -> None:
+        """
+        Применяет к кешу изменения, накопленные за этап синхронизации, одним вызовом.
+        """
+
+        if self._cache_changes or self._cache_removed:
+            self._cache.bulk_update(
+                self._cache_changes,
+                self._cache_removed,
+                self._cache_checksums,
+                self._cache_fingerprints,
+            )
+            self._cache_changes = {}
+            self._cache_removed = set()
+            self._cache_checksums = {}
+            self._cache_fingerprints = {}
+
+    def _transfer_to_storage(
+        self,
+        file_name: str,
+        storage_info: dict[str, int],
+        func_transfer: callable,
+        is_upload: bool,
+        cloud_checksum: str | None = None,
+    ) -> bool:
         """
         Если файла нет в кеше, отправляет файл на загрузку в облако или на скачивание из облака с обновлением данных.
+        В кеше сохраняется отпечаток загружаемого локального файла или MD5 скачиваемого файла из облака.
+        Ошибка передачи файла записывается в лог.
 
         Args:
             file_name (str): Имя файла.
             storage_info (dict[str, int]): Информация о файлах в локальном или облачном хранилище.
             func_transfer (callable): Функция для загрузки или скачивания файла.
+            is_upload (bool): Флаг, указывающий, что файл загружается в облако.
+            cloud_checksum (str | None): MD5 содержимого файла в облаке. По умолчанию None.
 
-        Raises:
-            Exception: Если при передаче файла возникла ошибка.
+        Returns:
+            bool: True, если файл передан.
         """
 
+        if file_name in self._cache.metadata:
+            return False
+
+        if is_upload:
+            file_path = os.path.join(self._manager_local.path_local_folder, file_name)
+            checksum = None
+            fingerprint = self._hash_local_file(get_file_fingerprint, file_path)
+        else:
+            checksum = cloud_checksum
+            fingerprint = None
+
         try:
-            if file_name not in self._cache.metadata:
-                func_transfer(self._manager_local.path_local_folder, file_name)
-                self._update_data(file_name, storage_info)
+            func_transfer(self._manager_local.path_local_folder, file_name)
         except Exception as exc:
-            log.error(f"{exc}")
+            log.error(exc)
+            return False
+
+        self._update_data(file_name, storage_info, checksum, fingerprint)
+        return True
+
+    @staticmethod
+    def _hash_local_file(hash_func: callable, file_path: str) -> str | None:
+        """
+        Вычисляет хеш содержимого локального файла.
+
+        Args:
+            hash_func (callable): Функция для вычисления хеша файла.
+            file_path (str): Путь к файлу.
+
+        Returns:
+            str | None: Хеш содержимого файла либо None, если файл не удалось прочитать.
+        """
+
+        try:
+            return hash_func(file_path)
+        except OSError:
+            return None
+
+    def _is_local_content_unchanged(
+        self, file_name: str, file_path: str, fingerprint: str | None
+    ) -> bool:
+        """
+        Проверяет, совпадает ли содержимое локального файла с переданным при последней синхронизации.
+        Сравнивается отпечаток из кеша, а если его нет — MD5 из кеша, который вычисляется только в этом случае.
+
+        Args:
+            file_name (str): Имя файла.
+            file_path (str): Путь к локальному файлу.
+            fingerprint (str | None): Отпечаток содержимого локального файла.
+
+        Returns:
+            bool: True, если содержимое файла не изменилось.
+        """
+
+        if fingerprint is None:
+            return False
+
+        cached_fingerprint = self._cache.get_fingerprint(file_name)
+        if cached_fingerprint is not None:
+            return fingerprint == cached_fingerprint
+
+        cached_checksum = self._cache.get_checksum(file_name)
+        return (
+            cached_checksum is not None
+            and self._hash_local_file(get_file_md5, file_path) == cached_checksum
+        )
 
     def _reload_to_storage(
         self,
@@ -112,139 +339,281 @@ class StorageSynchronizer:
         mod_time: int,
         storage_info: dict[str, int],
         reload_func: callable,
+        is_upload: bool,
+        cloud_checksum: str | None = None,
     ) -> None:
         """
         Если время последнего изменения файла больше, чем в кеше, перезаписывает файл в локальном хранилище или
         в облаке с обновлением данных.
+        Если содержимое файла не изменилось, файл не передается, а в кеше обновляется только время его изменения.
+        При загрузке в облако локальный файл сравнивается по отпечатку, при скачивании — по MD5 из облака.
 
         Args:
             file_name (str): Имя файла.
             mod_time (int): Время последнего изменения файла.
             storage_info (dict[str, int]): Информация о файлах в локальном или облачном хранилище.
             reload_func (callable): Функция для перезаписи файла.
+            is_upload (bool): Флаг, указывающий, что файл перезаписывается в облаке.
+            cloud_checksum (str | None): MD5 содержимого файла в облаке. По умолчанию None.
 
         Raises:
-            TypeError: Если при ошибке перезаписи файла время возвращается как None.
             Exception: Если при перезаписи файла возникла ошибка.
         """
 
-        try:
-            if mod_time > self._cache.get_mod_time(file_name):
-                reload_func(self._manager_local.path_local_folder, file_name)
-                self._update_data(file_name, storage_info)
-        except TypeError:
+        cached_mod_time = self._cache.get_mod_time(file_name)
+        if cached_mod_time is None or mod_time <= cached_mod_time:
             return
+
+        file_path = os.path.join(self._manager_local.path_local_folder, file_name)
+        if is_upload:
+            fingerprint = self._hash_local_file(get_file_fingerprint, file_path)
+            if self._is_local_content_unchanged(file_name, file_path, fingerprint):
+                self._touch_data(file_name, mod_time, fingerprint=fingerprint)
+                return
+            checksum = None
+        else:
+            fingerprint = None
+            checksum = cloud_checksum
+            if (
+                checksum is not None
+                and self._hash_local_file(get_file_md5, file_path) == checksum
+            ):
+                self._touch_data(file_name, mod_time, checksum=checksum)
+                return
+
+        try:
+            reload_func(self._manager_local.path_local_folder, file_name)
+            self._update_data(file_name, storage_info, checksum, fingerprint)
         except Exception as exc:
             log.error(exc)
 
-    def _delete_in_storage(
+    def _delete_file(
         self,
         manager: ManagerLocalStorage | ManagerYandexDiskStorage,
-        storage_info: dict[str, int],
-        is_first_launch: bool = False,
+        file_name: str,
+        storage_info_other: dict[str, int],
     ) -> None:
         """
-        Если в кеше отсутствует файл, удаляет файл из локального хранилища или из облака с обновлением данных.
+        Удаляет файл из локального хранилища или из облака с обновлением данных.
 
         Args:
             manager (ManagerLocalStorage | ManagerYandexDiskStorage): Менеджер хранилища.
-            storage_info (dict[str, int]): Информация о файлах в локальном или облачном хранилище.
-            is_first_launch (bool): Флаг для выполнения первого запуска синхронизации файлов. По умолчанию False.
+            file_name (str): Имя файла.
+            storage_info_other (dict[str, int]): Информация о файлах в хранилище, из которого удаляется файл.
 
         Raises:
             FileNotFoundError: Если при удалении файла он не найден в локальном хранилище.
             Exception: Если при удалении файла возникла ошибка.
         """
 
-        storage_info_other = (
-            self._local_info if storage_info == self._cloud_info else self._cloud_info
-        )
-
-        if not storage_info and storage_info == self._local_info and is_first_launch:
-            self._cache.delete_data_cache()
-
-        for file_name in list(self._cache.metadata):
-            try:
-                if file_name not in storage_info and not is_first_launch:
-                    try:
-                        manager.delete(file_name)
-                        self._transfer_to_storage(
-                            file_name, self._local_info, self._manager_cloud.load
-                        )
-                        self._delete_data(file_name, storage_info_other)
-                    except FileNotFoundError as exc:
-                        log.error(exc)
-                        self._cache.delete_file_cache(file_name)
-                        log.info(f"{file_name} удален из кеша.")
-                    except Exception as exc:
-                        log.error(exc)
-
-                if file_name not in storage_info and is_first_launch:
-                    if storage_info == self._cloud_info:
-                        self._manager_cloud.load(
-                            self._manager_local.path_local_folder, file_name
-                        )
-                        self._update_data(file_name, storage_info)
-
-            except FileNotFoundError as exc:
-                self._cache.delete_file_cache(file_name)
-                log.error(exc)
-            except Exception as exc:
-                log.error(exc)
+        try:
+            manager.delete(file_name)
+            self._delete_data(file_name, storage_info_other)
+        except FileNotFoundError as exc:
+            log.error(exc)
+            with self._lock:
+                self._cache_removed.add(file_name)
+            log.info(f"{file_name} удален из кеша.")
+        except Exception as exc:
+            log.error(exc)
 
-    def _sync_files_change_locally(self) -> None:
+    def _restore_in_cloud(self, file_name: str, storage_info: dict[str, int]) -> None:
         """
-        Синхронизирует файлы в локальном хранилище с облаком.
+        Загружает в облако файл, который есть в кеше, но отсутствует в облаке, с обновлением данных
+        и отпечатка его содержимого.
+
+        Args:
+            file_name (str): Имя файла.
+            storage_info (dict[str, int]): Информация о файлах в облаке.
 
         Raises:
-            Exception: Если при синхронизации локальных изменений возникла ошибка.
+            FileNotFoundError: Если файл не найден в локальном хранилище.
+            Exception: Если при загрузке файла возникла ошибка.
         """
 
+        file_path = os.path.join(self._manager_local.path_local_folder, file_name)
+        fingerprint = self._hash_local_file(get_file_fingerprint, file_path)
         try:
-            for file_name, local_mod_time in self._local_info.items():
-                self._transfer_to_storage(
-                    file_name, self._cloud_info, self._manager_cloud.load
-                )
-
-                self._reload_to_storage(
-                    file_name,
-                    local_mod_time,
-                    self._cloud_info,
-                    self._manager_cloud.reload,
-                )
+            self._manager_cloud.load(self._manager_local.path_local_folder, file_name)
+            self._update_data(file_name, storage_info, fingerprint=fingerprint)
+        except FileNotFoundError as exc:
+            with self._lock:
+                self._cache_removed.add(file_name)
+            log.error(exc)
         except Exception as exc:
             log.error(exc)
 
-    def _sync_files_change_cloudy(self) -> None:
+    def _delete_in_storage(
+        self,
+        manager: ManagerLocalStorage | ManagerYandexDiskStorage,
+        storage_info: dict[str, int],
+        storage_info_other: dict[str, int],
+        is_local: bool,
+        is_first_launch: bool = False,
+    ) -> None:
+        """
+        Если в хранилище отсутствует файл из кеша, удаляет файл из другого хранилища с обновлением данных.
+        При первом запуске файлы, отсутствующие в облаке, вместо этого загружаются в облако.
+
+        Args:
+            manager (ManagerLocalStorage | ManagerYandexDiskStorage): Менеджер хранилища, из которого удаляются файлы.
+            storage_info (dict[str, int]): Информация о файлах в локальном или облачном хранилище.
+            storage_info_other (dict[str, int]): Информация о файлах в хранилище, из которого удаляются файлы.
+            is_local (bool): Флаг, указывающий, что storage_info — информация о файлах в локальном хранилище.
+            is_first_launch (bool): Флаг для выполнения первого запуска синхронизации файлов. По умолчанию False.
         """
-        Синхронизирует файлы в облаке с локальным хранилищем.
+
+        if is_first_launch:
+            if is_local and not storage_info:
+                self._cache.delete_data_cache()
+            if is_local:
+                return
+
+        _, missing, _ = self._cache.diff(storage_info)
+        if is_first_launch:
+            futures = [
+                self._pool.submit(self._restore_in_cloud, file_name, storage_info)
+                for file_name in missing
+            ]
+        else:
+            futures = [
+                self._pool.submit(
+                    self._delete_file, manager, file_name, storage_info_other
+                )
+                for file_name in missing
+            ]
+        self._wait_all(futures)
+
+    def _sync_direction(
+        self,
+        src_info: dict[str, int],
+        dst_info: dict[str, int],
+        transfer_func: callable,
+        reload_func: callable,
+        is_upload: bool,
+    ) -> None:
+        """
+        Синхронизирует новые и измененные файлы одного хранилища с другим.
+
+        Args:
+            src_info (dict[str, int]): Информация о файлах в хранилище, изменения которого передаются.
+            dst_info (dict[str, int]): Информация о файлах в хранилище, в которое передаются изменения.
+            transfer_func (callable): Функция для загрузки или скачивания нового файла.
+            reload_func (callable): Функция для перезаписи измененного файла.
+            is_upload (bool): Флаг, указывающий, что изменения передаются из локального хранилища в облако.
 
         Raises:
-            Exception: Если при синхронизации изменений в облаке возникла ошибка.
+            Exception: Если при синхронизации изменений возникла ошибка.
         """
 
         try:
-            for file_name, cloud_mod_time in self._cloud_info.items():
-                self._transfer_to_storage(
-                    file_name, self._local_info, self._manager_cloud.download
+            added, _, modified = self._cache.diff(src_info)
+            cloud_checksums = {} if is_upload else self._cloud_checksums
+            submit = self._pool.submit
+            futures = [
+                submit(
+                    self._transfer_to_storage,
+                    file_name,
+                    dst_info,
+                    transfer_func,
+                    is_upload,
+                    cloud_checksums.get(file_name),
                 )
-
-                self._reload_to_storage(
+                for file_name in added
+            ]
+            futures.extend(
+                submit(
+                    self._reload_to_storage,
                     file_name,
-                    cloud_mod_time,
-                    self._local_info,
-                    self._manager_cloud.update,
+                    src_info[file_name],
+                    dst_info,
+                    reload_func,
+                    is_upload,
+                    cloud_checksums.get(file_name),
                 )
+                for file_name in modified
+            )
+            self._wait_all(futures)
         except Exception as exc:
-            log.error(f"Ошибка при синхронизации изменений в облаке: {exc}")
+            log.error(f"Ошибка при синхронизации изменений: {exc}")
+
+    def _do_sync(self, is_first_launch: bool) -> None:
+        """
+        Выполняет одну попытку полной синхронизации файлов.
+        При первом запуске информация о файлах в облаке запрашивается в пуле потоков одновременно
+        со сканированием локальной директории. MD5 файлов в облаке сохраняются сразу после получения
+        информации о них: загрузка файлов в облако сбрасывает сохраненный менеджером облака список.
+
+        Args:
+            is_first_launch (bool): Флаг для выполнения первого запуска синхронизации файлов.
+
+        Raises:
+            ConnectionError: Если при синхронизации файлов возникла ошибка соединения.
+            UnauthorizedError: Если при синхронизации файлов возникла ошибка авторизации.
+            OSError: Если при синхронизации файлов возникла ошибка доступа к локальному хранилищу.
+            DiskNotFoundError: Если при синхронизации файлов возникла ошибка доступа к облачному хранилищу.
+        """
+
+        self._apply_time_offset()
+        self._manager_cloud.reset_checked_folders()
+        cloud_info_future = (
+            self._pool.submit(self._manager_cloud.get_info) if is_first_launch else None
+        )
+        self._local_info = self._get_local_info(is_first_launch)
+        if cloud_info_future is not None:
+            self._cloud_info = cloud_info_future.result()
+            self._cloud_checksums = self._manager_cloud.checksums
+
+        if not self._cache.metadata:
+            self._cache.metadata = self._local_info
+
+        self._sync_direction(
+            self._local_info,
+            self._cloud_info,
+            self._manager_cloud.load,
+            self._manager_cloud.reload,
+            True,
+        )
+        self._commit_cache_changes()
+        self._delete_in_storage(
+            self._manager_cloud,
+            self._local_info,
+            self._cloud_info,
+            True,
+            is_first_launch,
+        )
+        self._commit_cache_changes()
+
+        if is_first_launch:
+            self._sync_direction(
+                self._cloud_info,
+                self._local_info,
+                self._manager_cloud.download,
+                self._manager_cloud.update,
+                False,
+            )
+            self._commit_cache_changes()
+            self._delete_in_storage(
+                self._manager_local,
+                self._cloud_info,
+                self._local_info,
+                False,
+                is_first_launch,
+            )
+        log.info("Синхронизация файлов завершена.")
 
-    def synchronize_data(self, is_first_launch: bool = False) -> None:
+    def synchronize_data(self, is_first_launch: bool = False) -> dict[str, int]:
         """
         Выполняет полную синхронизацию файлов.
+        При ошибке доступа к локальной директории или к папке в облаке синхронизация повторяется как первый
+        запуск не более _MAX_RETRIES раз с экспоненциально растущей паузой между попытками.
 
         Args:
             is_first_launch (bool): Флаг для выполнения первого запуска синхронизации файлов. По умолчанию False.
 
+        Returns:
+            dict[str, int]: Статистика синхронизации: "changed" — количество переданных или удаленных файлов.
+
         Raises:
             ConnectionError: Если при синхронизации файлов возникла ошибка соединения.
             UnauthorizedError: Если при синхронизации файлов возникла ошибка авторизации.
@@ -256,35 +625,38 @@ class StorageSynchronizer:
         log.info(
             f"Программа синхронизации файлов начинает работу с директорией {self._manager_local.path_local_folder}."
         )
-        try:
-            self._local_info = self._manager_local.get_info()
-
-            if not self._cache.metadata:
-                self._cache.metadata = self._local_info
-
-            self._sync_files_change_locally()
-            self._delete_in_storage(
-                self._manager_cloud, self._local_info, is_first_launch
-            )
-
-            if is_first_launch:
-                self._cloud_info = self._manager_cloud.get_info()
-                self._sync_files_change_cloudy()
-                self._delete_in_storage(
-                    self._manager_local, self._cloud_info, is_first_launch
+        self._changed_count = 0
+        for attempt in range(self._MAX_RETRIES):
+            try:
+                self._do_sync(is_first_launch)
+                break
+            except ConnectionError:
+                log.error(f"Неудачная попытка синхронизации файлов. Ошибка соединения.")
+                break
+            except UnauthorizedError as exc:
+                log.error(f"Неудачная попытка синхронизации файлов. {exc}")
+                break
+            except (OSError, DiskNotFoundError) as exc:
+                log.error(exc)
+                if attempt == self._MAX_RETRIES - 1:
+                    log.error(
+                        f"Не удалось устранить ошибку доступа к директории за {self._MAX_RETRIES} попыток."
+                    )
+                    break
+                retry_delay = min(self._MAX_RETRY_DELAY, 2**attempt)
+                log.info(
+                    "Для устранения ошибки доступа к директории через "
+                    f"{retry_delay} с. выполняется перезапуск синхронизации файлов..."
                 )
-            log.info("Синхронизация файлов завершена.")
-        except ConnectionError:
-            log.error(f"Неудачная попытка синхронизации файлов. Ошибка соединения.")
-        except UnauthorizedError as exc:
-            log.error(f"Неудачная попытка синхронизации файлов. {exc}")
-        except (OSError, DiskNotFoundError) as exc:
-            log.error(exc)
-            log.info(
-                "Для устранения ошибки доступа к директории выполняется перезапуск синхронизации файлов..."
-            )
-            self.synchronize_data(is_first_launch=True)
-        except Exception as exc:
-            log.error(
-                f"Неудачная попытка синхронизации файлов. Ошибка {type(exc).__name__}: {exc}"
-            )
+                sleep(retry_delay)
+                is_first_launch = True
+            except Exception as exc:
+                log.error(
+                    f"Неудачная попытка синхронизации файлов. Ошибка {type(exc).__name__}: {exc}"
+                )
+                break
+            finally:
+                self._commit_cache_changes()
+                self._cache.flush()
+
+        return {"changed": self._changed_count}
@@ -0,0 +1,175 @@
+import os
+from threading import Lock
+
+from config.logging_config import log
+
+try:
+    from watchdog.events import FileSystemEvent, FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEvent = None
+    FileSystemEventHandler = object
+    Observer = None
+
+
+class _FolderEventHandler(FileSystemEventHandler):
+    """
+    Обработчик событий файловой системы, передающий их в LocalFolderWatcher.
+    """
+
+    def __init__(self, watcher: "LocalFolderWatcher") -> None:
+        """
+        Инициализация _FolderEventHandler.
+
+        Args:
+            watcher (LocalFolderWatcher): Объект, накапливающий изменения файлов.
+        """
+
+        super().__init__()
+        self._watcher = watcher
+
+    def on_any_event(self, event: FileSystemEvent) -> None:
+        """
+        Передает событие файловой системы в LocalFolderWatcher.
+
+        Args:
+            event (FileSystemEvent): Событие файловой системы.
+        """
+
+        self._watcher.register_event(event)
+
+
+class LocalFolderWatcher:
+    """
+    Класс для отслеживания изменений файлов в локальной директории средствами операционной системы
+    (inotify в Linux) с помощью библиотеки watchdog.
+
+    Накопленные имена измененных файлов позволяют при синхронизации обновлять информацию только о них
+    вместо полного сканирования директории. Если библиотека watchdog не установлена или отслеживание
+    прервано, синхронизатор выполняет полное сканирование.
+
+    Attributes:
+        _path_local_folder (str): Путь к отслеживаемой локальной директории.
+        _changes (set[str]): Имена файлов, измененных с момента последнего запроса.
+        _is_stale (bool): Флаг, указывающий, что накопленные изменения неполны и требуется полное
+            сканирование директории.
+        _lock (Lock): Блокировка для доступа к накопленным изменениям из потока watchdog.
+        _observer (Observer | None): Наблюдатель watchdog.
+
+    Methods:
+        start: Запускает отслеживание изменений в директории.
+        stop: Останавливает отслеживание изменений.
+        register_event (FileSystemEvent): Регистрирует событие файловой системы.
+        pop_changes -> set[str] | None: Возвращает и очищает накопленные имена измененных файлов.
+    """
+
+    _EVENT_TYPES = ("created", "deleted", "modified", "moved")
+
+    def __init__(self, path_local_folder: str) -> None:
+        """
+        Инициализация LocalFolderWatcher.
+
+        Args:
+            path_local_folder (str): Путь к отслеживаемой локальной директории.
+        """
+
+        self._path_local_folder = os.path.abspath(path_local_folder)
+        self._changes = set()
+        self._is_stale = True
+        self._lock = Lock()
+        self._observer = None
+
+    def start(self) -> None:
+        """
+        Запускает отслеживание изменений в локальной директории.
+        """
+
+        if Observer is None:
+            log.info(
+                "Библиотека watchdog не установлена. "
+                "Изменения в локальной директории определяются полным сканированием."
+            )
+            return
+
+        if self._observer is None:
+            self._observer = Observer()
+            self._observer.start()
+        self._schedule()
+
+    def stop(self) -> None:
+        """
+        Останавливает отслеживание изменений в локальной директории.
+        """
+
+        if self._observer is not None:
+            self._observer.stop()
+            self._observer.join()
+            self._observer = None
+
+    def _schedule(self) -> None:
+        """
+        Назначает отслеживание локальной директории. При ошибке изменения определяются полным
+        сканированием до следующей успешной попытки.
+        """
+
+        try:
+            self._observer.unschedule_all()
+            self._observer.schedule(
+                _FolderEventHandler(self), self._path_local_folder, recursive=False
+            )
+            with self._lock:
+                self._changes.clear()
+                self._is_stale = False
+        except OSError as exc:
+            log.error(
+                f"Не удалось отслеживать изменения в директории {self._path_local_folder}: {exc}"
+            )
+
+    def register_event(self, event: FileSystemEvent) -> None:
+        """
+        Регистрирует событие файловой системы. Удаление или перемещение отслеживаемой директории
+        помечает накопленные изменения как неполные.
+
+        Args:
+            event (FileSystemEvent): Событие файловой системы.
+        """
+
+        if event.event_type not in self._EVENT_TYPES:
+            return
+
+        paths = [os.fsdecode(event.src_path)]
+        if event.event_type == "moved":
+            paths.append(os.fsdecode(event.dest_path))
+
+        with self._lock:
+            for path in paths:
+                if path == self._path_local_folder:
+                    if event.event_type in ("deleted", "moved"):
+                        self._is_stale = True
+                elif (
+                    not event.is_directory
+                    and os.path.dirname(path) == self._path_local_folder
+                ):
+                    self._changes.add(os.path.basename(path))
+
+    def pop_changes(self) -> set[str] | None:
+        """
+        Возвращает имена файлов, измененных с момента последнего вызова, и очищает их.
+
+        Returns:
+            set[str] | None: Имена измененных файлов либо None, если отслеживание не работает
+                и требуется полное сканирование директории.
+        """
+
+        if self._observer is None or not self._observer.is_alive():
+            return None
+
+        with self._lock:
+            if not self._is_stale:
+                changes = self._changes
+                self._changes = set()
+                return changes
+
+        if os.path.isdir(self._path_local_folder):
+            self._schedule()
+        return None
@@ -1,11 +1,19 @@
 from config.settings import settings
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import ConnectionError, HTTPError
+from urllib3.util.retry import Retry
 import os
 
-from utils.exceptions import DiskNotFoundError, UnauthorizedError
+from utils.exceptions import DiskNotFoundError, TransferError, UnauthorizedError
 from config.logging_config import log
-from utils.utils import upload_file, download_file, to_unix_timestamp
+from utils.utils import (
+    IGNORED_FILE_PREFIXES,
+    upload_file,
+    download_file,
+    to_unix_timestamp,
+)
 
 
 class ManagerYandexDiskStorage:
@@ -15,7 +23,15 @@ class ManagerYandexDiskStorage:
     Attributes:
         _url (str): URL для работы с API Яндекс.Диска.
         _headers (dict[str, str]): Заголовки для авторизации запросов на Яндекс.Диск.
+        _session (requests.Session): HTTP-сессия с пулом постоянных соединений для всех запросов.
         _backup_folder (str): Путь к папке в облаке, где хранятся файлы.
+        _cloud_cache (tuple[tuple[str | None, int | None], dict[str, int], dict[str, str]] | None): Версия
+            папки резервного копирования (время изменения и количество файлов), полученная для неё
+            информация о файлах и MD5 их содержимого.
+        _folder_etag (str | None): ETag ответа на короткий запрос о папке резервного копирования, подтвердивший
+            актуальность _cloud_cache.
+        _checked_folders (set[str]): Локальные директории, существование которых проверено в текущем цикле
+            синхронизации.
 
     Methods:
         backup_folder: Геттер и сеттер для пути к текущей папке резервного копирования.
@@ -25,21 +41,31 @@ class ManagerYandexDiskStorage:
         update (file_path: str): Обновляет локальный файл, основываясь на облачной версии.
         delete (file_name: str): Удаляет файл из облачного хранилища.
         get_info: Возвращает информацию о файлах в облаке с указанием времени их изменения.
+        checksums: Возвращает MD5 содержимого файлов в облаке по последнему полученному списку файлов.
+        reset_checked_folders: Сбрасывает проверки локальных директорий перед новым циклом синхронизации.
     """
 
-    def __init__(self, token: str, backup_folder: str):
+    _PAGE_LIMIT = 1000
+
+    def __init__(self, token: str, backup_folder: str, max_connections: int = 32):
         """
         Инициализация ManagerYandexDiskStorage.
 
         Args:
             token (str): OAuth-токен для авторизации в Яндекс.Диске.
             backup_folder (str): Путь к папке резервного копирования в облачном хранилище.
+            max_connections (int): Максимальное количество постоянных соединений с одним хостом.
+                Должно быть не меньше количества одновременно передаваемых файлов. По умолчанию 32.
         """
 
         self._url = "https://cloud-api.yandex.net/v1/disk/resources"
         self._headers = {"Authorization": f"OAuth {token}"}
+        self._session = self._create_session(max_connections)
         self._create_backup_folder(backup_folder)
         self._backup_folder = backup_folder
+        self._cloud_cache = None
+        self._folder_etag = None
+        self._checked_folders = set()
 
     @property
     def backup_folder(self) -> str:
@@ -63,6 +89,58 @@ class ManagerYandexDiskStorage:
 
         self._create_backup_folder(backup_folder)
         self._backup_folder = backup_folder
+        self._reset_cloud_cache()
+
+    @property
+    def checksums(self) -> dict[str, str]:
+        """
+        Возвращает MD5 содержимого файлов в облаке по последнему полученному списку файлов.
+
+        Returns:
+            dict[str, str]: Словарь с именами файлов и MD5 их содержимого либо пустой словарь,
+                если список файлов устарел после изменений в облаке.
+        """
+
+        return self._cloud_cache[2] if self._cloud_cache else {}
+
+    def _reset_cloud_cache(self) -> None:
+        """
+        Сбрасывает сохраненную информацию о файлах в облаке вместе с подтвердившим ее ETag.
+        """
+
+        self._cloud_cache = None
+        self._folder_etag = None
+
+    @staticmethod
+    def _create_session(max_connections: int) -> requests.Session:
+        """
+        Создает HTTP-сессию с пулом постоянных соединений (keep-alive) и повтором запросов
+        при временных ошибках сервера.
+        Повторяются только запросы GET и DELETE: тело загружаемого файла при повторе PUT
+        уже прочитано.
+
+        Args:
+            max_connections (int): Максимальное количество постоянных соединений с одним хостом.
+
+        Returns:
+            requests.Session: Настроенная HTTP-сессия.
+        """
+
+        retry = Retry(
+            total=3,
+            backoff_factor=0.2,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET", "DELETE"],
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=16, pool_maxsize=max_connections, max_retries=retry
+        )
+
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
 
     def _create_backup_folder(self, backup_folder: str) -> None:
         """
@@ -78,13 +156,15 @@ class ManagerYandexDiskStorage:
         """
         params = {"path": backup_folder}
         try:
-            check_response = requests.get(
+            check_response = self._session.get(
                 self._url, headers=self._headers, params=params
             )
             if check_response.status_code == 200:
                 return
 
-            response = requests.put(self._url, headers=self._headers, params=params)
+            response = self._session.put(
+                self._url, headers=self._headers, params=params
+            )
 
             if response.status_code == 201:
                 log.info(
@@ -117,37 +197,89 @@ class ManagerYandexDiskStorage:
 
         Raises:
             ConnectionError: Если при обращении к серверу возникла ошибка соединения.
+            HTTPError: Если сервер вернул ответ с кодом ошибки.
             KeyError: Если при получении URL для загрузки/скачивания файла сервер возвращает сообщение об ошибке.
-            Exception: При непредвиденной ошибке.
         """
 
         url = f"{self._url}/{end_point}"
         params = {"path": f"{self.backup_folder}/{file_name}", "overwrite": "true"}
         try:
-            response = requests.get(url, headers=self._headers, params=params)
+            response = self._session.get(url, headers=self._headers, params=params)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
 
             if "href" in data:
-                return response.json().get("href")
+                return data["href"]
             else:
                 raise KeyError(
                     f"Не удалось получить  URL для файла: {data.get('message', 'Неизвестная ошибка')}"
                 )
         except ConnectionError:
             raise ConnectionError("Ошибка соединения")
-        except Exception as exc:
-            raise Exception(
-                f"Ошибка при получения URL для файла {file_name} {type(exc).__name__}: {exc}"
-            )
 
-    def _get_info_backup_folder(self) -> list[dict[str, str]] | None:
+    def _get_folder_data(
+        self, params: dict[str, str | int], etag: str | None = None
+    ) -> tuple[dict | None, str | None]:
+        """
+        Возвращает данные о папке резервного копирования по указанным параметрам запроса.
+        Если передан ETag предыдущего ответа, запрос выполняется условно (If-None-Match): при ответе
+        304 Not Modified данные не возвращаются.
+
+        Args:
+            params (dict[str, str | int]): Дополнительные параметры запроса (fields, limit, offset).
+            etag (str | None): ETag предыдущего ответа на такой же запрос. По умолчанию None.
+
+        Returns:
+            tuple[dict | None, str | None]: Данные о папке резервного копирования либо None, если они
+                не изменились, и ETag ответа.
+
+        Raises:
+            KeyError: Если при получении информации о папке сервер возвращает сообщение об ошибке.
+            UnauthorizedError: Если произошла ошибка авторизации.
+            DiskNotFoundError: Если в облаке не найдена папка для синхронизации файлов.
+        """
+
+        params = {"path": self.backup_folder, **params}
+        headers = {**self._headers, "If-None-Match": etag} if etag else self._headers
+        response = self._session.get(self._url, headers=headers, params=params)
+        if response.status_code == 304:
+            return None, etag
+
+        data = orjson.loads(response.content)
+        if "_embedded" in data:
+            return data, response.headers.get("ETag")
+        if data.get("error") == "DiskNotFoundError":
+            raise DiskNotFoundError(data["message"])
+        if data.get("error") == "UnauthorizedError":
+            raise UnauthorizedError
+        raise KeyError(
+            f'Ошибка {data.get("error")}: {data.get("message", "Ошибка при получении информации о папке.")}'
+        )
+
+    @staticmethod
+    def _get_folder_version(data: dict) -> tuple[str | None, int | None]:
+        """
+        Возвращает версию папки резервного копирования: время её изменения и количество файлов в ней.
+
+        Args:
+            data (dict): Данные о папке резервного копирования.
+
+        Returns:
+            tuple[str | None, int | None]: Время изменения папки и количество файлов в ней.
+        """
+
+        return data.get("modified"), data["_embedded"].get("total")
+
+    def _get_info_backup_folder(
+        self,
+    ) -> tuple[tuple[str | None, int | None], list[dict[str, str]]] | None:
         """
         Возвращает первичную информацию о содержимом папки резервного копирования.
+        Содержимое папки запрашивается постранично по _PAGE_LIMIT элементов.
 
         Returns:
-            list[dict[str, str]] | None: Список с информацией о файлах в облачной папке либо None при возникновении
-                ошибки.
+            tuple[tuple[str | None, int | None], list[dict[str, str]]] | None: Версия папки и список
+                с информацией о файлах в облачной папке либо None при возникновении ошибки.
 
         Raises:
             ConnectionError: Если при получении информации о файлах возникла ошибка соединения.
@@ -159,28 +291,31 @@ class ManagerYandexDiskStorage:
 
         fields = ",".join(
             [
+                "modified",
+                "_embedded.total",
+                "_embedded.items.md5",
                 "_embedded.items.modified",
                 "_embedded.items.name",
-                # "_embedded.items.path",
                 "_embedded.items.type",
             ]
         )
-        params = {"path": self.backup_folder, "fields": fields}
 
         try:
-            response = requests.get(self._url, headers=self._headers, params=params)
-
-            data = response.json()
-            try:
-                return data["_embedded"]["items"]
-            except KeyError:
-                if data.get("error") == "DiskNotFoundError":
-                    raise DiskNotFoundError(data["message"])
-                if data.get("error") == "UnauthorizedError":
-                    raise UnauthorizedError
-                raise KeyError(
-                    f'Ошибка {data.get("error")}: {data.get("message", "Ошибка при получении информации о папке.")}'
+            items = []
+            version = None
+            offset = 0
+            while True:
+                data, _ = self._get_folder_data(
+                    {"fields": fields, "limit": self._PAGE_LIMIT, "offset": offset}
                 )
+                if version is None:
+                    version = self._get_folder_version(data)
+
+                page = data["_embedded"].get("items", [])
+                items.extend(page)
+                if len(page) < self._PAGE_LIMIT:
+                    return version, items
+                offset += self._PAGE_LIMIT
         except ConnectionError:
             raise ConnectionError("Ошибка соединения.")
         except UnauthorizedError as exc:
@@ -193,6 +328,67 @@ class ManagerYandexDiskStorage:
             )
             return None
 
+    def _is_cloud_cache_valid(self) -> bool:
+        """
+        Проверяет коротким запросом, изменилась ли папка резервного копирования с момента сохранения
+        информации о файлах в _cloud_cache.
+        Запрос передает ETag предыдущей проверки, поэтому для неизменившейся папки сервер может ответить
+        304 Not Modified без тела ответа. Новый ETag сохраняется, только если версия папки совпала
+        с версией в _cloud_cache.
+
+        Returns:
+            bool: True, если сохраненная информация о файлах актуальна.
+
+        Raises:
+            ConnectionError: Если при проверке возникла ошибка соединения.
+            UnauthorizedError: Если произошла ошибка авторизации.
+            DiskNotFoundError: Если в облаке не найдена папка для синхронизации файлов.
+        """
+
+        if self._cloud_cache is None:
+            return False
+
+        try:
+            data, etag = self._get_folder_data(
+                {"fields": "modified,_embedded.total", "limit": 1}, self._folder_etag
+            )
+        except (ConnectionError, UnauthorizedError, DiskNotFoundError):
+            raise
+        except Exception:
+            return False
+        if data is None:
+            return True
+        if self._get_folder_version(data) != self._cloud_cache[0]:
+            return False
+        self._folder_etag = etag
+        return True
+
+    def reset_checked_folders(self) -> None:
+        """
+        Сбрасывает проверки существования локальных директорий перед новым циклом синхронизации.
+        """
+
+        self._checked_folders = set()
+
+    def _check_local_folder(self, local_folder_path: str) -> None:
+        """
+        Проверяет существование локальной директории один раз за цикл синхронизации.
+
+        Args:
+            local_folder_path (str): Путь к локальной директории.
+
+        Raises:
+            OSError: Если локальная директория по указанному пути не найдена.
+        """
+
+        if local_folder_path in self._checked_folders:
+            return
+        if not os.path.isdir(local_folder_path):
+            raise OSError(
+                f"Указанного пути к локальному хранилищу {local_folder_path} не существует."
+            )
+        self._checked_folders.add(local_folder_path)
+
     def load(
         self, local_folder_path: str, file_name: str, is_load: bool = True
     ) -> None:
@@ -207,25 +403,23 @@ class ManagerYandexDiskStorage:
         Raises:
             OSError: Если локальная директория по указанному пути не найдена.
             FileNotFoundError: Если файл не найден в локальной директории.
-            Exception: При непредвиденной ошибке.
+            TransferError: Если файл не удалось загрузить в облако.
         """
 
         add_text = "" if is_load else "пере"
-        if not os.path.isdir(local_folder_path):
-            raise OSError(
-                f"Указанного пути к локальному хранилищу {local_folder_path} не существует."
-            )
+        self._check_local_folder(local_folder_path)
 
         local_file_path = os.path.join(local_folder_path, file_name)
         try:
             load_url = self._get_transfer_url(file_name, end_point="upload")
-            upload_file(load_url, local_file_path)
+            upload_file(load_url, local_file_path, self._session)
+            self._reset_cloud_cache()
             if is_load:
                 log.info(f"Файл {file_name} успешно записан.")
         except FileNotFoundError:
             raise FileNotFoundError(f"Файл {file_name} не найден.")
         except Exception as exc:
-            raise Exception(f"Файл {file_name} не {add_text}записан. {exc}")
+            raise TransferError(file_name, f"{add_text}записан", exc) from exc
 
     def reload(self, local_folder_path: str, file_name: str) -> None:
         """Перезаписывает файл в облачном хранилище.
@@ -258,25 +452,19 @@ class ManagerYandexDiskStorage:
 
         Raises:
             OSError: Если локальная директория по указанному пути не найдена.
-            HTTPError: Если возникла ошибка при загрузке файла в облачное хранилище.
-            Exception: При непредвиденной ошибке.
+            TransferError: Если файл не удалось скачать из облака.
         """
 
         local_file_path = os.path.join(local_folder_path, file_name)
 
-        if not os.path.isdir(local_folder_path):
-            raise OSError(
-                f"Указанного пути к локальному хранилищу {local_folder_path} не существует."
-            )
+        self._check_local_folder(local_folder_path)
         try:
             download_url = self._get_transfer_url(file_name, end_point="download")
-            download_file(download_url, local_file_path)
+            download_file(download_url, local_file_path, self._session)
             if is_download:
                 log.info(f"Файл {file_name} успешно скачан.")
-        except HTTPError as exc:
-            log.error(f"Файл {file_name} не скачан. Ошибка {type(exc).__name__}.")
         except Exception as exc:
-            raise Exception(f"Файл {file_name} не скачан. Ошибка {type(exc).__name__}.")
+            raise TransferError(file_name, "скачан", exc) from exc
 
     def update(self, local_folder_path: str, file_name: str) -> None:
         """
@@ -297,42 +485,42 @@ class ManagerYandexDiskStorage:
 
     def delete(self, file_name: str):
         """
-        Удаляет файл из облачного хранилища.
+        Удаляет файл из облачного хранилища. Если файл в облаке не найден, удаление не требуется.
 
         Args:
             file_name (str): Имя файла для удаления.
 
         Raises:
-            KeyError: Если файл не найден в облачном хранилище.
             ConnectionError: Если при удалении файла возникла ошибка соединения.
-            Exception: При непредвиденной ошибке.
+            TransferError: Если файл не удалось удалить из облака.
         """
 
         try:
-            if file_name not in self.get_info():
+            params = {"path": f"{self.backup_folder}/{file_name}"}
+            response = self._session.delete(
+                self._url, headers=self._headers, params=params
+            )
+            self._reset_cloud_cache()
+            if response.status_code == 404:
                 log.info(
                     f"Файл {file_name} не найден в папке {self.backup_folder}. Удаление не требуется."
                 )
                 return
-            params = {"path": f"{self.backup_folder}/{file_name}"}
-            response = requests.delete(self._url, headers=self._headers, params=params)
             response.raise_for_status()
             log.info(f"Файл {file_name} успешно удален.")
             return response
-        except KeyError as exc:
-            log.error(f"{type(exc).__name__}: {exc}")
         except ConnectionError:
             raise ConnectionError(
                 f"Файл {file_name} в облаке не удален. Ошибка соединения"
             )
         except Exception as exc:
-            raise Exception(
-                f"Файл {file_name} в облаке не удален. Ошибка {type(exc).__name__}"
-            )
+            raise TransferError(file_name, "удален из облака", exc) from exc
 
     def get_info(self) -> dict[str, int]:
         """
         Возвращает информацию о файлах в облачном хранилище.
+        Если папка резервного копирования не изменилась с предыдущего запроса, возвращается сохраненная
+        информация без повторного получения списка файлов.
 
         Returns:
             dict[str, int]: Информация о файлах в облачном хранилище в виде словаря.
@@ -343,20 +531,28 @@ class ManagerYandexDiskStorage:
         """
 
         try:
-            list_files_cloud = self._get_info_backup_folder()
+            if self._is_cloud_cache_valid():
+                return dict(self._cloud_cache[1])
+            info_backup_folder = self._get_info_backup_folder()
         except DiskNotFoundError:
+            self._reset_cloud_cache()
             self._create_backup_folder(self._backup_folder)
             raise DiskNotFoundError
         except KeyError:
             return {}
 
-        if not list_files_cloud:
+        if not info_backup_folder:
             return {}
 
+        version, list_files_cloud = info_backup_folder
         cloud_files_info = {}
+        cloud_checksums = {}
 
         for item in list_files_cloud:
-            if item["name"].startswith("~") or item["type"] != "file":
+            if (
+                item["name"].startswith(IGNORED_FILE_PREFIXES)
+                or item["type"] != "file"
+            ):
                 log.info(
                     f"{item["name"]} в облаке является {item["type"]} и не синхронизируется."
                 )
@@ -364,7 +560,12 @@ class ManagerYandexDiskStorage:
                 cloud_files_info[item["name"]] = to_unix_timestamp(
                     item["modified"], has_timezone=True
                 )
-        return cloud_files_info
+                if "md5" in item:
+                    cloud_checksums[item["name"]] = item["md5"]
+
+        self._cloud_cache = (version, cloud_files_info, cloud_checksums)
+        self._folder_etag = None
+        return dict(cloud_files_info)
 
 
 if __name__ == "__main__":
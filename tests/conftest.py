@@ -0,0 +1,143 @@
+import sys
+from types import ModuleType, SimpleNamespace
+from pathlib import Path
+from unittest.mock import patch
+
+import orjson
+import pytest
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+# Модуль config.settings завершает работу без файла .env, поэтому для тестов он подменяется.
+_settings_module = ModuleType("config.settings")
+_settings_module.settings = SimpleNamespace()
+sys.modules.setdefault("config.settings", _settings_module)
+
+from sync.yandex_disk import ManagerYandexDiskStorage  # noqa: E402
+
+
+def _make_response(
+    status_code: int, data: dict | None = None, etag: str | None = None
+) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = orjson.dumps(data or {})
+    response.url = "https://cloud-api.yandex.net/v1/disk/resources"
+    if etag:
+        response.headers["ETag"] = etag
+    return response
+
+
+class StubSession:
+    """
+    HTTP-сессия, имитирующая папку резервного копирования в API Яндекс.Диска.
+
+    Attributes:
+        files (dict[str, str]): Имена файлов в папке и время их изменения в формате ISO 8601.
+        checksums (dict[str, str]): Имена файлов и MD5 их содержимого.
+        fail_listing (bool): Флаг, при котором запрос списка файлов завершается ошибкой сервера.
+        transfer_status (int): Код ответа на запрос ссылки для загрузки или скачивания файла.
+        deleted (list[str]): Пути файлов, для которых был отправлен запрос DELETE.
+    """
+
+    def __init__(self) -> None:
+        self.files = {}
+        self.checksums = {}
+        self.fail_listing = False
+        self.transfer_status = 200
+        self.deleted = []
+
+    @property
+    def etag(self) -> str:
+        return f'"{len(self.files)}"'
+
+    def get(
+        self, url: str, headers: dict | None = None, params: dict | None = None, **kwargs
+    ) -> requests.Response:
+        params = params or {}
+        if url.endswith(("/download", "/upload")):
+            return _make_response(self.transfer_status, {"href": f"{url}/href"})
+        if params.get("limit") == 1:
+            if (headers or {}).get("If-None-Match") == self.etag:
+                return _make_response(304)
+            data = {"modified": "", "_embedded": {"total": len(self.files)}}
+            return _make_response(200, data, self.etag)
+        if self.fail_listing:
+            return _make_response(500, {"error": "InternalError"})
+        items = [
+            {"name": name, "type": "file", "modified": modified}
+            | ({"md5": self.checksums[name]} if name in self.checksums else {})
+            for name, modified in self.files.items()
+        ]
+        data = {"modified": "", "_embedded": {"total": len(items), "items": items}}
+        return _make_response(200, data, self.etag)
+
+    def delete(self, url: str, **kwargs) -> requests.Response:
+        self.deleted.append(kwargs.get("params", {}).get("path"))
+        return _make_response(204)
+
+
+@pytest.fixture
+def stub_session() -> StubSession:
+    return StubSession()
+
+
+@pytest.fixture
+def manager_cloud(stub_session) -> ManagerYandexDiskStorage:
+    with patch.object(ManagerYandexDiskStorage, "_create_backup_folder"):
+        manager_cloud = ManagerYandexDiskStorage("token", "backup")
+    manager_cloud._session = stub_session
+    return manager_cloud
+
+
+class FakeCloud:
+    """
+    Менеджер облачного хранилища, хранящий информацию о файлах в памяти и запоминающий переданные файлы.
+    Как ManagerYandexDiskStorage, сбрасывает MD5 файлов после загрузки файла в облако.
+
+    Attributes:
+        files (dict[str, int]): Имена файлов в облаке и время их изменения.
+        uploaded (list[str]): Имена файлов, загруженных или перезаписанных в облаке.
+        downloaded (list[str]): Имена файлов, скачанных из облака.
+        updated (list[str]): Имена локальных файлов, обновленных по облачной версии.
+        deleted (list[str]): Имена файлов, удаленных из облака.
+    """
+
+    def __init__(
+        self,
+        files: dict[str, int] | None = None,
+        checksums: dict[str, str] | None = None,
+    ) -> None:
+        self.files = dict(files or {})
+        self._checksums = dict(checksums or {})
+        self.uploaded = []
+        self.downloaded = []
+        self.updated = []
+        self.deleted = []
+
+    @property
+    def checksums(self) -> dict[str, str]:
+        return self._checksums
+
+    def reset_checked_folders(self) -> None:
+        pass
+
+    def get_info(self) -> dict[str, int]:
+        return dict(self.files)
+
+    def load(self, path_local_folder: str, file_name: str) -> None:
+        self._checksums = {}
+        self.uploaded.append(file_name)
+
+    def reload(self, path_local_folder: str, file_name: str) -> None:
+        self.load(path_local_folder, file_name)
+
+    def download(self, path_local_folder: str, file_name: str) -> None:
+        self.downloaded.append(file_name)
+
+    def update(self, path_local_folder: str, file_name: str) -> None:
+        self.updated.append(file_name)
+
+    def delete(self, file_name: str) -> None:
+        self.deleted.append(file_name)
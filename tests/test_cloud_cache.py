@@ -0,0 +1,21 @@
+def test_unchanged_folder_uses_cached_info(stub_session, manager_cloud):
+    stub_session.files["a.txt"] = "2024-08-21T10:11:12+00:00"
+    first_info = manager_cloud.get_info()
+    stub_session.fail_listing = True
+
+    assert manager_cloud.get_info() == first_info
+    assert manager_cloud.get_info() == first_info
+
+
+def test_etag_of_changed_folder_is_not_kept_after_failed_listing(
+    stub_session, manager_cloud
+):
+    stub_session.files["a.txt"] = "2024-08-21T10:11:12+00:00"
+    manager_cloud.get_info()
+    stub_session.files["b.txt"] = "2024-08-22T10:11:12+00:00"
+    stub_session.fail_listing = True
+
+    assert manager_cloud.get_info() == {}
+
+    stub_session.fail_listing = False
+    assert set(manager_cloud.get_info()) == {"a.txt", "b.txt"}
@@ -0,0 +1,45 @@
+from utils.utils import get_file_fingerprint, get_file_md5
+from sync.local_storage import ManagerLocalStorage
+from sync.metadata_manager import MetadataCache
+from sync.sync_data import StorageSynchronizer
+from conftest import FakeCloud
+
+
+def test_unchanged_cloud_file_is_not_downloaded_after_upload(tmp_path):
+    local_folder = tmp_path / "local"
+    local_folder.mkdir()
+    (local_folder / "new.txt").write_text("new")
+    (local_folder / "same.txt").write_text("same")
+    cache = MetadataCache(str(tmp_path / "cache.json"))
+    cache.bulk_update({"same.txt": 2_000_000_000}, [])
+    manager_cloud = FakeCloud(
+        {"same.txt": 2_000_000_100},
+        {"same.txt": get_file_md5(str(local_folder / "same.txt"))},
+    )
+    synchronizer = StorageSynchronizer(
+        ManagerLocalStorage(str(local_folder)), manager_cloud, cache, max_workers=2
+    )
+
+    synchronizer.synchronize_data(is_first_launch=True)
+
+    assert manager_cloud.updated == []
+    assert cache.get_mod_time("same.txt") == 2_000_000_100
+
+
+def test_first_transfers_record_hashes(tmp_path):
+    local_folder = tmp_path / "local"
+    local_folder.mkdir()
+    (local_folder / "local.txt").write_text("local")
+    cache = MetadataCache(str(tmp_path / "cache.json"))
+    cache.bulk_update({"old.txt": 1}, [])
+    manager_cloud = FakeCloud({"old.txt": 1, "cloud.txt": 2}, {"cloud.txt": "md5"})
+    synchronizer = StorageSynchronizer(
+        ManagerLocalStorage(str(local_folder)), manager_cloud, cache, max_workers=2
+    )
+
+    synchronizer.synchronize_data(is_first_launch=True)
+
+    assert cache.get_fingerprint("local.txt") == get_file_fingerprint(
+        str(local_folder / "local.txt")
+    )
+    assert cache.get_checksum("cloud.txt") == "md5"
@@ -0,0 +1,55 @@
+import os
+
+import pytest
+
+from sync.local_storage import ManagerLocalStorage
+from sync.metadata_manager import MetadataCache
+from sync.sync_data import StorageSynchronizer
+from utils.exceptions import TransferError
+
+
+FILE_NAME = "report.txt"
+
+
+@pytest.fixture
+def synchronizer(tmp_path, stub_session, manager_cloud):
+    stub_session.files[FILE_NAME] = "2024-08-21T10:11:12+00:00"
+    stub_session.checksums[FILE_NAME] = "d41d8cd98f00b204e9800998ecf8427e"
+    stub_session.transfer_status = 503
+    local_folder = tmp_path / "local"
+    local_folder.mkdir()
+    cache = MetadataCache(str(tmp_path / "cache.json"))
+    synchronizer = StorageSynchronizer(
+        ManagerLocalStorage(str(local_folder)), manager_cloud, cache, max_workers=2
+    )
+    yield synchronizer
+    cache.flush()
+
+
+def test_download_raises_transfer_error_on_failed_href(synchronizer):
+    with pytest.raises(TransferError):
+        synchronizer._manager_cloud.download(
+            synchronizer._manager_local.path_local_folder, FILE_NAME
+        )
+
+
+def test_failed_download_is_not_cached(synchronizer):
+    cloud_info = synchronizer._manager_cloud.get_info()
+
+    is_transferred = synchronizer._transfer_to_storage(
+        FILE_NAME, cloud_info, synchronizer._manager_cloud.download, False
+    )
+    synchronizer._commit_cache_changes()
+
+    assert not is_transferred
+    assert FILE_NAME not in synchronizer._cache.metadata
+
+
+def test_failed_download_is_not_deleted_from_cloud(synchronizer):
+    synchronizer._do_sync(is_first_launch=True)
+    synchronizer._do_sync(is_first_launch=False)
+
+    local_folder = synchronizer._manager_local.path_local_folder
+    assert FILE_NAME not in synchronizer._cache.metadata
+    assert not os.path.exists(os.path.join(local_folder, FILE_NAME))
+    assert synchronizer._manager_cloud._session.deleted == []
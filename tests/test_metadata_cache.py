@@ -0,0 +1,15 @@
+import pytest
+
+from sync.metadata_manager import MetadataCache
+
+
+@pytest.mark.parametrize("content", [b"[]", b"null", b"42", b'"text"'])
+def test_cache_with_non_object_root_is_loaded_empty(tmp_path, content):
+    cache_path = tmp_path / "cache.json"
+    cache_path.write_bytes(content)
+
+    cache = MetadataCache(str(cache_path))
+
+    assert cache.metadata == {}
+    assert cache.checksums == {}
+    assert cache.fingerprints == {}
@@ -0,0 +1,50 @@
+from threading import Event
+from time import monotonic
+from unittest.mock import patch
+
+from sync.local_storage import ManagerLocalStorage
+from sync.metadata_manager import MetadataCache
+from sync.sync_data import StorageSynchronizer
+from utils.ntp import NTPOffset, ntp_offset
+from conftest import FakeCloud
+
+
+def test_offset_change_does_not_reupload_files(tmp_path):
+    local_folder = tmp_path / "local"
+    local_folder.mkdir()
+    (local_folder / "a.txt").write_text("data")
+    manager_cloud = FakeCloud()
+    cache = MetadataCache(str(tmp_path / "cache.json"))
+    synchronizer = StorageSynchronizer(
+        ManagerLocalStorage(str(local_folder)), manager_cloud, cache, max_workers=2
+    )
+    synchronizer.synchronize_data(is_first_launch=True)
+    mod_time = cache.get_mod_time("a.txt")
+    manager_cloud.uploaded.clear()
+
+    offset = ntp_offset.offset
+    ntp_offset._pending_offset = offset + 3600
+    try:
+        synchronizer.synchronize_data()
+    finally:
+        ntp_offset._offset = offset
+        ntp_offset._pending_offset = None
+
+    assert manager_cloud.uploaded == []
+    assert cache.get_mod_time("a.txt") == mod_time + 3600
+
+
+def test_start_does_not_wait_for_ntp_server():
+    response = Event()
+    with patch("utils.ntp.get_ntp_time", side_effect=lambda: response.wait(5) and 7):
+        offset = NTPOffset()
+        started_at = monotonic()
+        offset.start()
+        elapsed = monotonic() - started_at
+        assert offset.offset == 0
+        response.set()
+        offset._thread.join(0.5)
+
+    assert elapsed < 1
+    assert offset.apply_pending() == 7
+    assert offset.offset == 7
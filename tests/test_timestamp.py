@@ -0,0 +1,36 @@
+from datetime import datetime
+
+import pytest
+
+from utils.utils import to_unix_timestamp
+
+
+@pytest.mark.parametrize(
+    "time_str",
+    [
+        "2024-08-21T10:11:12+00:00",
+        "2024-08-21T10:11:12+03:30",
+        "2024-08-21T10:11:12-05:00",
+        "2024-02-29T23:59:59+00:00",
+        "2024-08-21 10:11:12+00:00",
+    ],
+)
+def test_matches_fromisoformat(time_str):
+    expected = int(datetime.fromisoformat(time_str).timestamp())
+
+    assert to_unix_timestamp(time_str, has_timezone=True) == expected
+
+
+@pytest.mark.parametrize(
+    "time_str",
+    [
+        "2024-02-30T10:00:00+00:00",
+        "2023-02-29T10:00:00+00:00",
+        "2024-08-21T25:00:00+00:00",
+        "2024-08-21T10:60:00+00:00",
+        "2024-08-21T10:00:60+00:00",
+    ],
+)
+def test_invalid_values_are_rejected(time_str):
+    with pytest.raises(ValueError):
+        to_unix_timestamp(time_str, has_timezone=True)
@@ -1,2 +1,4 @@
 from . import exceptions
+from . import ntp
+from . import paths
 from . import utils
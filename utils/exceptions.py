@@ -10,3 +10,23 @@ class UnauthorizedError(Exception):
 
     def __init__(self, message="Неправильный токен API Яндекс Диска."):
         super().__init__(message)
+
+
+class TransferError(Exception):
+    """Ошибка, возникающая, если файл не удалось передать между локальным хранилищем и облаком."""
+
+    __slots__ = ("file_name", "action", "cause")
+
+    def __init__(
+        self, file_name: str, action: str, cause: BaseException | None = None
+    ):
+        super().__init__(file_name, action, cause)
+        self.file_name = file_name
+        self.action = action
+        self.cause = cause
+
+    def __str__(self) -> str:
+        message = f"Файл {self.file_name} не {self.action}."
+        if self.cause is not None:
+            message += f" Ошибка {type(self.cause).__name__}: {self.cause}"
+        return message
@@ -0,0 +1,125 @@
+from threading import Lock, Thread
+from time import sleep
+
+from config.logging_config import log
+from utils.utils import get_ntp_time
+
+
+class NTPOffset:
+    """
+    Класс для получения разницы во времени между системным и серверным NTP временем в фоновом потоке.
+
+    Разница запрашивается при запуске и затем обновляется каждые _REFRESH_PERIOD секунд, а после
+    неудачного запроса — через _RETRY_PERIOD секунд. Новое значение учитывается, только если оно
+    отличается от текущего больше чем на _DRIFT_TOLERANCE секунд: колебания в пределах округления
+    не сдвигают временные метки всех файлов.
+    Полученное в фоновом потоке значение не применяется сразу, а ожидает вызова apply_pending между
+    циклами синхронизации, чтобы временные метки одного цикла вычислялись с одной разницей во времени.
+    Запуск не ожидает ответа NTP сервера: до его получения разница во времени равна нулю.
+
+    Attributes:
+        _offset (int): Разница во времени между системным и серверным в секундах.
+        _pending_offset (int | None): Полученная от NTP сервера разница во времени, еще не примененная.
+        _is_synchronized (bool): Флаг, указывающий, что разница получена от NTP сервера.
+        _lock (Lock): Блокировка для запуска фонового потока и изменения разницы во времени.
+        _thread (Thread | None): Фоновый поток обновления разницы во времени.
+
+    Methods:
+        offset: Возвращает разницу во времени между системным и серверным.
+        start: Запускает фоновое обновление разницы во времени.
+        apply_pending: Применяет полученную в фоновом потоке разницу во времени.
+    """
+
+    _REFRESH_PERIOD = 600
+    _RETRY_PERIOD = 30
+    _DRIFT_TOLERANCE = 2
+
+    def __init__(self) -> None:
+        """
+        Инициализация NTPOffset.
+        """
+
+        self._offset = 0
+        self._pending_offset = None
+        self._is_synchronized = False
+        self._lock = Lock()
+        self._thread = None
+
+    @property
+    def offset(self) -> int:
+        """
+        Возвращает разницу во времени между системным и серверным.
+
+        Returns:
+            int: Разница во времени между системным и серверным в секундах.
+        """
+
+        return self._offset
+
+    def start(self) -> None:
+        """
+        Запускает фоновое обновление разницы во времени без ожидания ответа NTP сервера.
+        Полученная позже разница применяется перед очередным циклом синхронизации методом apply_pending,
+        а время изменения файлов в кеше при этом пересчитывается.
+        """
+
+        with self._lock:
+            if self._thread is None:
+                self._thread = Thread(
+                    target=self._worker, name="ntp-offset", daemon=True
+                )
+                self._thread.start()
+
+    def apply_pending(self) -> int:
+        """
+        Применяет разницу во времени, полученную в фоновом потоке после предыдущего применения.
+        Вызывается между циклами синхронизации, когда передача файлов не выполняется.
+
+        Returns:
+            int: Изменение разницы во времени в секундах либо 0, если новое значение не получено.
+        """
+
+        with self._lock:
+            if self._pending_offset is None:
+                return 0
+            shift = self._pending_offset - self._offset
+            self._offset = self._pending_offset
+            self._pending_offset = None
+        return shift
+
+    def _update(self) -> bool:
+        """
+        Запрашивает разницу во времени у NTP сервера и сохраняет её до применения методом apply_pending.
+
+        Returns:
+            bool: True, если разница во времени получена.
+        """
+
+        delta_time = get_ntp_time()
+        if delta_time is None:
+            return False
+
+        with self._lock:
+            if (
+                not self._is_synchronized
+                or abs(delta_time - self._offset) > self._DRIFT_TOLERANCE
+            ):
+                self._pending_offset = delta_time
+            self._is_synchronized = True
+        return True
+
+    def _worker(self) -> None:
+        """
+        Периодически обновляет разницу во времени в фоновом потоке.
+        """
+
+        while True:
+            try:
+                is_updated = self._update()
+            except Exception as exc:
+                log.error(f"Ошибка при обновлении NTP времени: {exc}")
+                is_updated = False
+            sleep(self._REFRESH_PERIOD if is_updated else self._RETRY_PERIOD)
+
+
+ntp_offset = NTPOffset()
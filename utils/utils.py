@@ -1,5 +1,8 @@
+import calendar
+import hashlib
 import os
 from datetime import datetime, timezone
+from functools import lru_cache
 from math import ceil
 from time import time
 
@@ -9,6 +12,16 @@ from requests import RequestException
 
 from config.logging_config import log
 
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+
+IGNORED_FILE_PREFIXES = ("~", ".~", ".#")
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+HASH_CHUNK_SIZE = 1 << 20
+
 
 def get_file_path(folder_path: str, file_name: str) -> str:
     """
@@ -25,13 +38,65 @@ def get_file_path(folder_path: str, file_name: str) -> str:
     return os.path.join(folder_path, file_name)
 
 
-def upload_file(upload_url: str, file_path: str) -> None:
+def get_file_md5(file_path: str) -> str:
+    """
+    Возвращает MD5 содержимого файла. Файл читается частями по HASH_CHUNK_SIZE байт.
+
+    Args:
+        file_path (str): Путь к файлу.
+
+    Returns:
+        str: MD5 содержимого файла в шестнадцатеричном виде.
+
+    Raises:
+        OSError: Если при чтении файла возникла ошибка.
+    """
+
+    md5 = hashlib.md5()
+    with open(file_path, "rb") as file_data:
+        while chunk := file_data.read(HASH_CHUNK_SIZE):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+def get_file_fingerprint(file_path: str) -> str:
+    """
+    Возвращает отпечаток содержимого файла для определения изменений локальных файлов.
+    Используется BLAKE3, а если библиотека blake3 не установлена — BLAKE2b из hashlib.
+    Отпечаток начинается с названия алгоритма, поэтому отпечатки разных алгоритмов не совпадают.
+
+    Args:
+        file_path (str): Путь к файлу.
+
+    Returns:
+        str: Отпечаток содержимого файла в виде "<алгоритм>:<хеш>".
+
+    Raises:
+        OSError: Если при чтении файла возникла ошибка.
+    """
+
+    if blake3 is not None:
+        algorithm, hasher = "blake3", blake3.blake3(max_threads=blake3.blake3.AUTO)
+    else:
+        algorithm, hasher = "blake2b", hashlib.blake2b()
+
+    with open(file_path, "rb") as file_data:
+        while chunk := file_data.read(HASH_CHUNK_SIZE):
+            hasher.update(chunk)
+    return f"{algorithm}:{hasher.hexdigest()}"
+
+
+def upload_file(
+    upload_url: str, file_path: str, session: requests.Session | None = None
+) -> None:
     """
     Загружает файл на указанный URL.
 
     Args:
         upload_url (str): URL для загрузки файла.
         file_path (str): Путь к файлу для загрузки.
+        session (requests.Session | None): HTTP-сессия для повторного использования соединений.
+            По умолчанию запрос выполняется без сессии.
 
     Raises:
         RequestException: Если произошла ошибка при загрузке файла.
@@ -39,35 +104,106 @@ def upload_file(upload_url: str, file_path: str) -> None:
 
     try:
         with open(file_path, "rb") as file_data:
-            response = requests.put(upload_url, file_data)
+            response = (session or requests).put(upload_url, file_data)
         response.raise_for_status()
     except RequestException as exc:
         raise RequestException(f"Ошибка при загрузке файла {file_path}: {exc}")
 
 
-def download_file(download_url: str, file_path: str) -> None:
+def download_file(
+    download_url: str, file_path: str, session: requests.Session | None = None
+) -> None:
     """
     Скачивает файл с указанного URL и сохраняет его по указанному пути.
+    Файл скачивается потоком частями по DOWNLOAD_CHUNK_SIZE байт во временный файл, который после
+    успешного скачивания заменяет файл по указанному пути.
 
     Args:
         download_url (str): URL для скачивания файла.
         file_path (str): Путь для сохранения скачанного файла.
+        session (requests.Session | None): HTTP-сессия для повторного использования соединений.
+            По умолчанию запрос выполняется без сессии.
 
     Raises:
         RequestException: Если произошла ошибка при скачивании файла.
     """
+
+    folder_path, file_name = os.path.split(file_path)
+    part_file_path = os.path.join(folder_path, f"~{file_name}.part")
     try:
-        response = requests.get(download_url)
-        response.raise_for_status()
-        with open(file_path, "wb") as file_data:
-            file_data.write(response.content)
+        with (session or requests).get(download_url, stream=True) as response:
+            response.raise_for_status()
+            with open(part_file_path, "wb") as file_data:
+                for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+                    file_data.write(chunk)
+        os.replace(part_file_path, file_path)
     except RequestException as exc:
         raise RequestException(f"Ошибка при скачивании файла {file_path}: {exc}")
+    finally:
+        if os.path.exists(part_file_path):
+            os.remove(part_file_path)
+
 
+def _parse_yandex_timestamp(time_str: str) -> int | None:
+    """
+    Быстро преобразует строку времени вида YYYY-MM-DDTHH:MM:SS+HH:MM в Unix timestamp без datetime.
+
+    Args:
+        time_str (str): Строка времени в формате ISO 8601 с часовым поясом.
 
+    Returns:
+        int | None: Время в формате Unix timestamp либо None, если строка имеет другой формат или содержит
+            недопустимые значения даты, времени или часового пояса.
+    """
+
+    if (
+        len(time_str) != 25
+        or time_str[10] != "T"
+        or time_str[19] not in "+-"
+        or time_str[4] + time_str[7] != "--"
+        or time_str[13] + time_str[16] + time_str[22] != ":::"
+    ):
+        return None
+
+    digits = (
+        time_str[0:4],
+        time_str[5:7],
+        time_str[8:10],
+        time_str[11:13],
+        time_str[14:16],
+        time_str[17:19],
+        time_str[20:22],
+        time_str[23:25],
+    )
+    if not all(part.isascii() and part.isdigit() for part in digits):
+        return None
+
+    year, month, day, hour, minute, second, offset_hour, offset_minute = map(
+        int, digits
+    )
+    if (
+        year < 1
+        or not 1 <= month <= 12
+        or not 1 <= day <= calendar.monthrange(year, month)[1]
+        or hour > 23
+        or minute > 59
+        or second > 59
+        or offset_hour > 23
+        or offset_minute > 59
+    ):
+        return None
+
+    timestamp = calendar.timegm((year, month, day, hour, minute, second))
+    offset = offset_hour * 3600 + offset_minute * 60
+    return timestamp - offset if time_str[19] == "+" else timestamp + offset
+
+
+@lru_cache(maxsize=8192)
 def to_unix_timestamp(time_str: str, has_timezone: bool = False) -> int:
     """
     Преобразует строку времени в Unix timestamp.
+    Результаты запоминаются: время изменения большинства файлов в облаке между опросами не меняется.
+    Строки вида YYYY-MM-DDTHH:MM:SS+HH:MM, которые возвращает Яндекс.Диск, разбираются без datetime.
 
     Args:
         time_str (str): Строка времени в формате ISO 8601.
@@ -77,6 +213,11 @@ def to_unix_timestamp(time_str: str, has_timezone: bool = False) -> int:
         int: Время в формате Unix timestamp.
     """
 
+    if has_timezone:
+        timestamp = _parse_yandex_timestamp(time_str)
+        if timestamp is not None:
+            return timestamp
+
     if has_timezone:
         dt = datetime.fromisoformat(time_str)
         return int(dt.astimezone(timezone.utc).timestamp())
@@ -85,12 +226,13 @@ def to_unix_timestamp(time_str: str, has_timezone: bool = False) -> int:
         return int(dt.timestamp())
 
 
-def get_ntp_time() -> int:
+def get_ntp_time() -> int | None:
     """
     Возвращает разницу во времени между локальным и серверным.
 
     Returns:
-         int: Разница во времени между локальным и серверным.
+         int | None: Разница во времени между локальным и серверным либо None, если NTP время
+            получить не удалось.
 
     Raises:
         Exception: Если при запросе к серверу для получения NTP времени возникла ошибка.
@@ -111,7 +253,7 @@ def get_ntp_time() -> int:
         log.error(
             f"Не удалось получить NTP время. Ошибка соединения. {exc}",
         )
-        return 0
+        return None
 
 
 def get_time_correlation(current_time: int | float, sync_time: int) -> int: